@@ -242,6 +242,7 @@ export interface ResetPolicyResponse {
   reset: boolean
   active_policy_id: string
   version: number
+  active?: ActivePolicy | null
 }
 
 export interface StatusResponse {
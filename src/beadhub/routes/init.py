@@ -14,6 +14,7 @@ from beadhub.names import CLASSIC_NAMES
 from beadhub.rate_limit import enforce_init_rate_limit
 from beadhub.redis_client import get_redis
 from beadhub.roles import ROLE_MAX_LENGTH, is_valid_role, normalize_role, role_to_alias_prefix
+from beadhub.routes.policies import get_active_policy
 from beadhub.routes.repos import canonicalize_git_url, extract_repo_name
 
 router = APIRouter(prefix="/v1/init", tags=["init"])
@@ -124,6 +125,7 @@ class InitResponse(BaseModel):
     repo_id: str | None = None
     canonical_origin: str | None = None
     workspace_id: str | None = None
+    active_policy_id: str | None = None
     alias: str
     created: bool = False
     workspace_created: bool = False
@@ -397,6 +399,16 @@ async def init(
                 payload.workspace_path or None,
             )
 
+    # Agents fetch the active policy right after init; report its id (seeding
+    # the default policy for new projects) so they can skip that lookup.
+    active_policy_id = await server_db.fetch_value(
+        "SELECT active_policy_id FROM {{tables.projects}} WHERE id = $1",
+        UUID(identity.project_id),
+    )
+    if active_policy_id is None:
+        policy = await get_active_policy(server_db, identity.project_id)
+        active_policy_id = policy.policy_id if policy else None
+
     return InitResponse(
         created_at=_now_iso(),
         api_key=identity.api_key,
@@ -406,6 +418,7 @@ async def init(
         repo_id=repo_id,
         canonical_origin=canonical_origin,
         workspace_id=identity.agent_id,
+        active_policy_id=str(active_policy_id) if active_policy_id else None,
         alias=identity.alias,
         created=identity.created,
         workspace_created=workspace_created,
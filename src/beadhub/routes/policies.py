@@ -15,11 +15,14 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import asyncpg.exceptions
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from pgdbm import AsyncDatabaseManager
+from pgdbm.errors import QueryError
 from pydantic import BaseModel, Field
 
 from beadhub.auth import enforce_actor_binding, validate_workspace_id
@@ -59,6 +62,32 @@ class PolicyVersion(BaseModel):
     updated_at: datetime
 
 
+# Bounds memory for servers hosting many projects; oldest entries go first.
+ACTIVE_POLICY_CACHE_MAX_ENTRIES = 1024
+
+
+@dataclass
+class _ActivePolicyCacheEntry:
+    policy_id: str
+    updated_at: datetime
+    bundle: PolicyBundle
+
+
+# Parsed bundles of recently read active policies, keyed by project id. Every
+# read still checks the row's policy_id/updated_at, so an entry is only reused
+# while it matches what the database holds.
+_ACTIVE_POLICY_CACHE: dict[str, _ActivePolicyCacheEntry] = {}
+
+
+def _cache_active_policy(project_id: str, policy: PolicyVersion) -> None:
+    _ACTIVE_POLICY_CACHE.pop(project_id, None)
+    if len(_ACTIVE_POLICY_CACHE) >= ACTIVE_POLICY_CACHE_MAX_ENTRIES:
+        _ACTIVE_POLICY_CACHE.pop(next(iter(_ACTIVE_POLICY_CACHE)))
+    _ACTIVE_POLICY_CACHE[project_id] = _ActivePolicyCacheEntry(
+        policy_id=policy.policy_id, updated_at=policy.updated_at, bundle=policy.bundle
+    )
+
+
 async def get_active_policy(
     db: AsyncDatabaseManager,
     project_id: str,
@@ -79,29 +108,42 @@ async def get_active_policy(
     Returns:
         The active PolicyVersion, or None if no policy and bootstrap disabled
     """
-    # Check if project has an active policy
+    cached = _ACTIVE_POLICY_CACHE.get(project_id)
+
+    # Check if project has an active policy. bundle_json is NOT NULL, so a NULL
+    # here means the cached bundle is still current and was not re-sent.
     result = await db.fetch_one(
         """
-        SELECT pp.policy_id, pp.project_id, pp.version, pp.bundle_json,
+        SELECT pp.policy_id, pp.project_id, pp.version,
+               CASE WHEN pp.policy_id = $2::UUID AND pp.updated_at = $3::TIMESTAMPTZ THEN NULL
+                    ELSE pp.bundle_json END AS bundle_json,
                pp.created_by_workspace_id, pp.created_at, pp.updated_at
         FROM {{tables.projects}} p
         JOIN {{tables.project_policies}} pp ON pp.policy_id = p.active_policy_id
         WHERE p.id = $1
         """,
         project_id,
+        cached.policy_id if cached else None,
+        cached.updated_at if cached else None,
     )
 
     if result:
-        # Parse bundle_json - may be dict or string depending on asyncpg codec
         bundle_data = result["bundle_json"]
-        if isinstance(bundle_data, str):
-            bundle_data = json.loads(bundle_data)
-
-        return PolicyVersion(
+        reused = False
+        if bundle_data is None and cached is not None:
+            bundle = cached.bundle
+            reused = True
+        else:
+            # Parse bundle_json - may be dict or string depending on asyncpg codec
+            if isinstance(bundle_data, str):
+                bundle_data = json.loads(bundle_data)
+            bundle = PolicyBundle(**bundle_data)
+
+        policy = PolicyVersion(
             policy_id=str(result["policy_id"]),
             project_id=str(result["project_id"]),
             version=result["version"],
-            bundle=PolicyBundle(**bundle_data),
+            bundle=bundle,
             created_by_workspace_id=(
                 str(result["created_by_workspace_id"])
                 if result["created_by_workspace_id"]
@@ -110,20 +152,53 @@ async def get_active_policy(
             created_at=result["created_at"],
             updated_at=result["updated_at"],
         )
+        if not reused:
+            _cache_active_policy(project_id, policy)
+        return policy
 
     if not bootstrap_if_missing:
         return None
 
     # Bootstrap default policy
     logger.info("Bootstrapping default policy for project %s", project_id)
-    policy = await create_policy_version(
-        db,
-        project_id=project_id,
-        base_policy_id=None,
-        bundle=get_default_bundle(),
-        created_by_workspace_id=None,
+    try:
+        policy = await create_policy_version(
+            db,
+            project_id=project_id,
+            base_policy_id=None,
+            bundle=get_default_bundle(),
+            created_by_workspace_id=None,
+        )
+    except QueryError as e:
+        if not isinstance(e.__cause__, asyncpg.exceptions.UniqueViolationError):
+            raise
+        # A concurrent bootstrap took this version number. Return its policy once
+        # active; if it is not activated yet, bootstrap again on the next version.
+        active = await get_active_policy(db, project_id, bootstrap_if_missing=False)
+        if active is not None:
+            return active
+        return await get_active_policy(db, project_id)
+    # Activate only if no policy became active meanwhile. Concurrent first reads
+    # (several agents running init on a new project at once) may each create a
+    # default version; exactly one is activated and every caller returns it.
+    # The losing versions stay in the history as inactive.
+    claimed = await db.fetch_one(
+        """
+        UPDATE {{tables.projects}}
+        SET active_policy_id = $2
+        WHERE id = $1 AND active_policy_id IS NULL
+        RETURNING id
+        """,
+        project_id,
+        policy.policy_id,
     )
-    await activate_policy(db, project_id=project_id, policy_id=policy.policy_id)
+    if not claimed:
+        return await get_active_policy(db, project_id, bootstrap_if_missing=False)
+
+    logger.info("Activated policy %s for project %s", policy.policy_id, project_id)
+    # Activation only touches the project row, so the version's updated_at is
+    # what the next read will see.
+    _cache_active_policy(project_id, policy)
     return policy
 
 
@@ -374,6 +449,23 @@ async def get_active_policy_endpoint(
     project_id = await get_project_from_auth(request, db)
     server_db = db.get_manager("server")
 
+    # Conditional GET fast path: the ETag only depends on policy_id and
+    # updated_at, so check it before loading and parsing the bundle.
+    if if_none_match:
+        current = await server_db.fetch_one(
+            """
+            SELECT pp.policy_id, pp.updated_at
+            FROM {{tables.projects}} p
+            JOIN {{tables.project_policies}} pp ON pp.policy_id = p.active_policy_id
+            WHERE p.id = $1
+            """,
+            project_id,
+        )
+        if current:
+            etag = _generate_etag(str(current["policy_id"]), current["updated_at"])
+            if if_none_match == etag:
+                return Response(status_code=304, headers={"ETag": etag})
+
     # Get or bootstrap active policy
     policy = await get_active_policy(server_db, project_id)
     if not policy:
@@ -411,7 +503,24 @@ async def get_active_policy_endpoint(
             detail="only_selected=true requires a role parameter",
         )
 
-    # Build response
+    if only_selected:
+        # Return only invariants + selected role
+        # Type narrowing: role is guaranteed non-None here (validated at line 370-374)
+        assert role is not None
+        roles = {role: RolePlaybook(**policy.bundle.roles[role])}
+    else:
+        roles = None
+
+    return _active_policy_response(policy, roles=roles, selected_role=selected_role_data)
+
+
+def _active_policy_response(
+    policy: PolicyVersion,
+    *,
+    roles: Optional[Dict[str, RolePlaybook]] = None,
+    selected_role: Optional[SelectedRole] = None,
+) -> ActivePolicyResponse:
+    """Build the GET /v1/policies/active body; ``roles`` defaults to every role in the bundle."""
     invariants = [
         Invariant(
             id=inv.get("id", ""),
@@ -420,13 +529,7 @@ async def get_active_policy_endpoint(
         )
         for inv in policy.bundle.invariants
     ]
-
-    if only_selected:
-        # Return only invariants + selected role
-        # Type narrowing: role is guaranteed non-None here (validated at line 370-374)
-        assert role is not None
-        roles = {role: RolePlaybook(**policy.bundle.roles[role])}
-    else:
+    if roles is None:
         roles = {
             k: RolePlaybook(
                 title=v.get("title", k),
@@ -442,7 +545,7 @@ async def get_active_policy_endpoint(
         updated_at=policy.updated_at,
         invariants=invariants,
         roles=roles,
-        selected_role=selected_role_data,
+        selected_role=selected_role,
         adapters=policy.bundle.adapters,
     )
 
@@ -489,6 +592,10 @@ class ResetPolicyResponse(BaseModel):
     reset: bool
     active_policy_id: str
     version: int
+    active: Optional[ActivePolicyResponse] = Field(
+        None,
+        description="The new active policy, when requested with include_active=true.",
+    )
 
 
 class PolicyHistoryItem(BaseModel):
@@ -795,6 +902,10 @@ async def activate_policy_endpoint(
 @router.post("/reset")
 async def reset_policy_to_default_endpoint(
     request: Request,
+    include_active: bool = Query(
+        False,
+        description="If true, embed the new active policy so no follow-up GET is needed.",
+    ),
     db: DatabaseInfra = Depends(get_db_infra),
 ) -> ResetPolicyResponse:
     """
@@ -802,6 +913,8 @@ async def reset_policy_to_default_endpoint(
 
     Reloads default invariants and roles from markdown files on disk, creates
     a new policy version, and activates it. Prior versions are preserved.
+    With include_active=true the response also carries the new active policy
+    in the same shape as GET /v1/policies/active.
 
     Requires an authenticated project context.
     """
@@ -866,4 +979,5 @@ async def reset_policy_to_default_endpoint(
         reset=True,
         active_policy_id=policy.policy_id,
         version=policy.version,
+        active=_active_policy_response(policy) if include_active else None,
     )
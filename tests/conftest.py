@@ -1,30 +1,72 @@
 import asyncio
+import itertools
 import logging
 import os
 import signal
 import subprocess
 import sys
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Generator
+from urllib.parse import urlsplit, urlunsplit
 
 import httpx
 import pytest
 import pytest_asyncio
+from asgi_lifespan import LifespanManager
 from aweb.db import DatabaseInfra as AwebDatabaseInfra
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 from pgdbm.fixtures.conftest import *  # noqa: F401,F403
 from pgdbm.testing import AsyncTestDatabase, DatabaseTestConfig
 from redis import Redis
 from redis.asyncio import Redis as AsyncRedis
 
+from beadhub.api import create_app
 from beadhub.db import DatabaseInfra
 
 from .db_utils import build_database_url
 
 logger = logging.getLogger(__name__)
 
-TEST_REDIS_URL = os.getenv("BEADHUB_TEST_REDIS_URL", "redis://localhost:6379/15")
-TEST_SERVER_PORT = 18765  # Use non-standard port for test server
+
+def _xdist_worker_index() -> int:
+    """Index of this pytest-xdist worker (``gw3`` -> 3); 0 when not running under xdist."""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    return int(worker.removeprefix("gw"))
+
+
+def _worker_redis_url(base_url: str) -> str:
+    """Give each xdist worker its own Redis DB so flushdb() calls don't collide.
+
+    Worker N uses the configured DB minus N, counting down so DB 0 (where real data
+    usually lives) is never flushed. Outside xdist the configured URL is used as is.
+    """
+    if "PYTEST_XDIST_WORKER" not in os.environ:
+        return base_url
+    parts = urlsplit(base_url)
+    configured = int(parts.path.lstrip("/") or 0)
+    index = configured - _xdist_worker_index()
+    if index < 1:
+        raise pytest.UsageError(
+            f"At most {configured} xdist workers are supported with Redis DB {configured} "
+            "(one DB per worker, never DB 0); configure a higher DB in BEADHUB_TEST_REDIS_URL"
+        )
+    return urlunsplit(parts._replace(path=f"/{index}"))
+
+
+TEST_REDIS_URL = _worker_redis_url(os.getenv("BEADHUB_TEST_REDIS_URL", "redis://localhost:6379/15"))
+# Use non-standard port for test server; one per xdist worker
+TEST_SERVER_PORT = 18765 + _xdist_worker_index()
 TEST_SERVER_URL = f"http://localhost:{TEST_SERVER_PORT}"
+# Base URL for in-process clients on the shared ASGI transport, parsed once.
+ASGI_BASE_URL = httpx.URL("http://test")
+
+_unique_seq = itertools.count()
+
+
+def uniq(prefix: str) -> str:
+    """Return a process-unique name like ``prefix-<pid>-<n>`` for slugs and repos."""
+    return f"{prefix}-{os.getpid()}-{next(_unique_seq)}"
 
 
 def auth_headers(api_key: str) -> dict[str, str]:
@@ -84,13 +126,24 @@ async def init_workspace():
     return _init
 
 
-@pytest.fixture
-def redis_client():
-    client = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+@pytest.fixture(scope="session")
+def redis_available() -> bool:
+    """Whether the test Redis answers PING; probed once per session."""
+    client = Redis.from_url(TEST_REDIS_URL)
     try:
         client.ping()
     except Exception:
+        return False
+    finally:
+        client.close()
+    return True
+
+
+@pytest.fixture
+def redis_client(redis_available):
+    if not redis_available:
         pytest.skip("Redis is not available")
+    client = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
     client.flushdb()
     yield client
     client.flushdb()
@@ -103,13 +156,11 @@ def set_redis_env(monkeypatch, redis_client):
 
 
 @pytest_asyncio.fixture
-async def async_redis() -> AsyncGenerator[AsyncRedis, None]:
+async def async_redis(redis_available: bool) -> AsyncGenerator[AsyncRedis, None]:
     """Fixture providing async Redis client for async tests."""
-    try:
-        redis = await AsyncRedis.from_url(TEST_REDIS_URL, decode_responses=True)
-        await redis.ping()
-    except Exception:
+    if not redis_available:
         pytest.skip("Redis is not available")
+    redis = await AsyncRedis.from_url(TEST_REDIS_URL, decode_responses=True)
     await redis.flushdb()
     yield redis
     await redis.flushdb()
@@ -191,6 +242,137 @@ async def aweb_db_infra(monkeypatch) -> AsyncGenerator[AwebDatabaseInfra, None]:
         await test_db.drop_test_database()
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_db_infra() -> AsyncGenerator[DatabaseInfra, None]:
+    """Provides a DatabaseInfra shared by every test in the session.
+
+    Tests using it must not depend on a pristine database; give each test
+    its own project slug. Tests consuming the shared fixtures must run in
+    the session event loop (``pytest.mark.asyncio(loop_scope="session")``).
+    """
+    # DATABASE_URL must outlive any single test: routes read settings per request.
+    mp = pytest.MonkeyPatch()
+    test_db, _, database_url = await _create_test_database()
+    mp.setenv("DATABASE_URL", database_url)
+
+    infra = DatabaseInfra()
+    await infra.initialize()
+
+    try:
+        yield infra
+    finally:
+        await infra.close()
+        await test_db.drop_test_database()
+        mp.undo()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_redis(redis_available: bool) -> AsyncGenerator[AsyncRedis, None]:
+    """Provides an async Redis client shared by every test in the session."""
+    if not redis_available:
+        pytest.skip("Redis is not available")
+    redis = await AsyncRedis.from_url(TEST_REDIS_URL, decode_responses=True)
+    await redis.flushdb()
+    yield redis
+    await redis.flushdb()
+    await redis.aclose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def reset_init_rate_limit(shared_redis: AsyncRedis) -> AsyncGenerator[None, None]:
+    """Drop /v1/init rate-limit counters after each test that uses the shared Redis.
+
+    Every in-process request comes from the same client IP, so without this
+    a module that calls /v1/init often enough starts getting 429s.
+    """
+    yield
+    async with shared_redis.pipeline(transaction=False) as pipe:
+        async for key in shared_redis.scan_iter(match="ratelimit:*"):
+            pipe.unlink(key)
+        await pipe.execute()
+
+
+@pytest.fixture(scope="session")
+def shared_app(shared_db_infra: DatabaseInfra, shared_redis: AsyncRedis) -> FastAPI:
+    """Provides one library-mode BeadHub app, built once per session.
+
+    Routes are registered at build time and all request state lives in the
+    database and Redis, so the app itself is safe to reuse across modules.
+    """
+    return create_app(db_infra=shared_db_infra, redis=shared_redis, serve_frontend=False)
+
+
+@pytest.fixture(scope="session")
+def shared_transport(shared_app: FastAPI) -> httpx.ASGITransport:
+    """One ASGI transport for every client talking to the shared app."""
+    return httpx.ASGITransport(app=shared_app)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def shared_client(
+    shared_app: FastAPI, shared_transport: httpx.ASGITransport
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Provides an in-process client for the session's shared app."""
+    async with LifespanManager(shared_app):
+        async with httpx.AsyncClient(transport=shared_transport, base_url=ASGI_BASE_URL) as client:
+            yield client
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def make_client(
+    shared_client: httpx.AsyncClient, shared_transport: httpx.ASGITransport
+) -> AsyncGenerator[Callable[[dict[str, str]], httpx.AsyncClient], None]:
+    """Factory for extra clients on the shared transport, e.g. one per tenant.
+
+    Each client carries its own default headers; all are closed after the test.
+    Depends on ``shared_client`` so the app lifespan is already running.
+    """
+    clients: list[httpx.AsyncClient] = []
+
+    def _make(headers: dict[str, str]) -> httpx.AsyncClient:
+        client = httpx.AsyncClient(
+            transport=shared_transport, base_url=ASGI_BASE_URL, headers=headers
+        )
+        clients.append(client)
+        return client
+
+    yield _make
+    for client in clients:
+        await client.aclose()
+
+
+@pytest.fixture(scope="module")
+def sync_client(shared_app: FastAPI) -> Generator[TestClient, None, None]:
+    """Synchronous client for requests rejected before any DB or Redis access.
+
+    The app runs on the TestClient's own thread and event loop, so requests
+    that reach the shared pool or Redis client must use ``shared_client``.
+    """
+    with TestClient(shared_app) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def bootstrapped_api_key(shared_client: httpx.AsyncClient) -> str:
+    """API key for a throwaway project, created once per module.
+
+    For tests that only need *an* authenticated caller, not a unique tenant.
+    """
+    project_slug = uniq("bootstrap")
+    resp = await shared_client.post(
+        "/v1/init",
+        json={
+            "project_slug": project_slug,
+            "project_name": project_slug,
+            "alias": "bootstrap-agent",
+            "human_name": "Bootstrap User",
+            "agent_type": "agent",
+        },
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()["api_key"]
+
+
 def _wait_for_server(url: str, timeout: float = 10.0) -> bool:
     """Wait for server to become healthy."""
     start = time.time()
@@ -245,7 +427,7 @@ def _kill_stale_server(port: int) -> None:
 
 
 @pytest.fixture(scope="session")
-def beadhub_server():
+def beadhub_server(redis_available):
     """Start a BeadHub server for integration tests.
 
     This fixture starts the server once per test session for efficiency.
@@ -255,28 +437,22 @@ def beadhub_server():
     Yields:
         str: The server URL (http://localhost:18765)
     """
+    # Skip before creating anything that would need cleaning up
+    if not redis_available:
+        pytest.skip("Redis is not available")
+
     # Clean up any stale server from previous runs
     _kill_stale_server(TEST_SERVER_PORT)
 
-    # Create test database using asyncio.run (proper event loop management)
-    test_db, db_name, database_url = asyncio.run(_create_test_database())
-
-    # Check Redis availability and flush - ensure cleanup before any skip
-    redis_client = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    redis_client = Redis.from_url(TEST_REDIS_URL)
     try:
-        redis_client.ping()
         redis_client.flushdb()
-    except Exception:
-        redis_client.close()
-        # Clean up database before skipping
-        try:
-            asyncio.run(_drop_test_database(db_name))
-        except Exception as e:
-            logger.warning(f"Failed to drop test database {db_name} during skip: {e}")
-        pytest.skip("Redis is not available")
     finally:
         redis_client.close()
 
+    # Create test database using asyncio.run (proper event loop management)
+    test_db, db_name, database_url = asyncio.run(_create_test_database())
+
     # Start server with test configuration
     env = {
         **os.environ,
@@ -332,7 +508,7 @@ def beadhub_server():
             server_proc.wait()
 
         # Flush Redis (clean up server state before dropping database)
-        redis_client = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+        redis_client = Redis.from_url(TEST_REDIS_URL)
         try:
             redis_client.flushdb()
         except Exception as e:
@@ -345,3 +521,37 @@ def beadhub_server():
             asyncio.run(_drop_test_database(db_name))
         except Exception as e:
             logger.warning(f"Failed to drop test database {db_name}: {e}")
+
+
+@pytest.fixture(scope="session")
+def http_client(beadhub_server: str) -> Generator[httpx.Client, None, None]:
+    """Keep-alive HTTP client bound to the session's BeadHub server."""
+    with httpx.Client(base_url=beadhub_server, timeout=10.0) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_http_client(beadhub_server: str) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Async counterpart of ``http_client`` for issuing independent requests concurrently."""
+    async with httpx.AsyncClient(base_url=beadhub_server, timeout=10.0) as client:
+        yield client
+
+
+@pytest.fixture
+def make_http_client(
+    beadhub_server: str,
+) -> Generator[Callable[[dict[str, str]], httpx.Client], None, None]:
+    """Factory for extra clients on the session server, e.g. one per project.
+
+    Each client carries its own default headers; all are closed after the test.
+    """
+    clients: list[httpx.Client] = []
+
+    def _make(headers: dict[str, str]) -> httpx.Client:
+        client = httpx.Client(base_url=beadhub_server, headers=headers, timeout=10.0)
+        clients.append(client)
+        return client
+
+    yield _make
+    for client in clients:
+        client.close()
@@ -37,6 +37,7 @@ async def test_beadhub_init_with_repo_origin_creates_workspace(db_infra, redis_c
             assert data["alias"] == "init-agent"
             assert data["created"] is True
             assert data["workspace_created"] is True
+            assert data["active_policy_id"]
 
             # Second call should be idempotent for workspace_id.
             resp2 = await client.post(
@@ -55,6 +56,7 @@ async def test_beadhub_init_with_repo_origin_creates_workspace(db_infra, redis_c
             assert data2["workspace_id"] == data["workspace_id"]
             assert data2["created"] is False
             assert data2["workspace_created"] is False
+            assert data2["active_policy_id"] == data["active_policy_id"]
 
 
 @pytest.mark.asyncio
@@ -12,7 +12,7 @@ from redis.asyncio import Redis
 
 from beadhub.api import create_app
 
-TEST_REDIS_URL = "redis://localhost:6379/15"
+from .conftest import TEST_REDIS_URL
 
 
 async def _init_project(client: AsyncClient, slug: str = "test-project") -> dict:
@@ -10,7 +10,8 @@ from redis.asyncio import Redis
 
 from beadhub.api import create_app
 
-TEST_REDIS_URL = "redis://localhost:6379/15"
+from .conftest import TEST_REDIS_URL
+
 TEST_REPO_ORIGIN = "git@github.com:anthropic/beadhub.git"
 
 
@@ -9,7 +9,7 @@ from redis.asyncio import Redis
 
 from beadhub.api import create_app
 
-TEST_REDIS_URL = "redis://localhost:6379/15"
+from .conftest import TEST_REDIS_URL
 
 
 def _auth_headers(api_key: str) -> dict[str, str]:
@@ -10,9 +10,10 @@ from redis.asyncio import Redis
 
 from beadhub.api import create_app
 
+from .conftest import TEST_REDIS_URL
+
 logger = logging.getLogger(__name__)
 
-TEST_REDIS_URL = "redis://localhost:6379/15"
 TEST_REPO_ORIGIN = "git@github.com:anthropic/beadhub.git"
 CANONICAL_ORIGIN = "github.com/anthropic/beadhub"
 
@@ -5,253 +5,275 @@ Verifies that projects with the same slug but different project_ids
 independent alias pools.
 """
 
+import asyncio
 import uuid
 
 import pytest
-from asgi_lifespan import LifespanManager
-from httpx import ASGITransport, AsyncClient
 
-from beadhub.api import create_app
+from beadhub.names import CLASSIC_NAMES
 
+from .conftest import auth_headers, uniq
+
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.usefixtures("reset_init_rate_limit"),
+]
+
+_INIT_DEFAULTS = {"agent_type": "agent"}
 
-async def _pre_create_project(db_infra, *, slug: str, tenant_id: str) -> str:
-    """Insert a project into server.projects (simulating beadhub-cloud).
 
-    Returns the project_id.
+async def _pre_create_projects(db_infra, specs: list[tuple[str, str]]) -> list[str]:
+    """Insert projects into server.projects (simulating beadhub-cloud).
+
+    ``specs`` is a list of ``(slug, tenant_id)`` pairs; all rows go in with a
+    single statement. Returns the project_ids in the same order.
     """
-    project_id = uuid.uuid4()
+    project_ids = [uuid.uuid4() for _ in specs]
+    slugs = [slug for slug, _ in specs]
     server_db = db_infra.get_manager("server")
     await server_db.execute(
         """
         INSERT INTO {{tables.projects}} (id, tenant_id, slug, name)
-        VALUES ($1, $2, $3, $4)
+        SELECT * FROM UNNEST($1::uuid[], $2::uuid[], $3::text[], $4::text[])
         """,
-        project_id,
-        uuid.UUID(tenant_id),
-        slug,
-        slug,
+        project_ids,
+        [uuid.UUID(tenant_id) for _, tenant_id in specs],
+        slugs,
+        slugs,
     )
-    return str(project_id)
+    return [str(project_id) for project_id in project_ids]
+
 
+async def _pre_create_project(db_infra, *, slug: str, tenant_id: str) -> str:
+    """Insert a single project; see ``_pre_create_projects``."""
+    (project_id,) = await _pre_create_projects(db_infra, [(slug, tenant_id)])
+    return project_id
 
-@pytest.mark.asyncio
-async def test_init_with_project_id_isolates_alias_pools(db_infra, redis_client_async):
+
+def _init_payload(slug: str, **fields) -> dict:
+    """Build a /v1/init body for ``slug``; ``fields`` add to or override the defaults."""
+    return _INIT_DEFAULTS | {"project_slug": slug, "project_name": slug} | fields
+
+
+async def test_init_with_project_id_isolates_alias_pools(shared_client, shared_db_infra):
     """Two cloud projects with the same slug but different project_ids get independent aliases."""
-    slug = f"shared-{uuid.uuid4().hex[:8]}"
+    slug = uniq("shared")
     tenant_a = str(uuid.uuid4())
     tenant_b = str(uuid.uuid4())
 
     # Simulate beadhub-cloud creating two projects with the same slug for different tenants
-    pid_a = await _pre_create_project(db_infra, slug=slug, tenant_id=tenant_a)
-    pid_b = await _pre_create_project(db_infra, slug=slug, tenant_id=tenant_b)
-
-    app = create_app(db_infra=db_infra, redis=redis_client_async, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            # Init first agent in project A
-            resp_a = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": slug,
-                    "project_id": pid_a,
-                    "project_name": slug,
-                    "human_name": "Agent A1",
-                    "agent_type": "agent",
-                    "repo_origin": f"git@github.com:test/{slug}-a.git",
-                    "role": "agent",
-                },
-            )
-            assert resp_a.status_code == 200, resp_a.text
-            alias_a1 = resp_a.json()["alias"]
-            project_id_a = resp_a.json()["project_id"]
-
-            # Init first agent in project B (same slug, different project_id)
-            resp_b = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": slug,
-                    "project_id": pid_b,
-                    "project_name": slug,
-                    "human_name": "Agent B1",
-                    "agent_type": "agent",
-                    "repo_origin": f"git@github.com:test/{slug}-b.git",
-                    "role": "agent",
-                },
-            )
-            assert resp_b.status_code == 200, resp_b.text
-            alias_b1 = resp_b.json()["alias"]
-            project_id_b = resp_b.json()["project_id"]
-
-            # Both should get the first name prefix (e.g., "alice-agent")
-            # because their alias pools are independent
-            assert alias_a1 == alias_b1, (
-                f"Expected same alias prefix for first agent in each project, "
-                f"got {alias_a1!r} vs {alias_b1!r}"
-            )
+    pid_a, pid_b = await _pre_create_projects(shared_db_infra, [(slug, tenant_a), (slug, tenant_b)])
+
+    # Init the first agent in project A and in project B (same slug, different
+    # project_id); the projects are independent, so the inits run concurrently.
+    resp_a, resp_b = await asyncio.gather(
+        shared_client.post(
+            "/v1/init",
+            json=_init_payload(
+                slug,
+                project_id=pid_a,
+                human_name="Agent A1",
+                repo_origin=f"git@github.com:test/{slug}-a.git",
+                role="agent",
+            ),
+        ),
+        shared_client.post(
+            "/v1/init",
+            json=_init_payload(
+                slug,
+                project_id=pid_b,
+                human_name="Agent B1",
+                repo_origin=f"git@github.com:test/{slug}-b.git",
+                role="agent",
+            ),
+        ),
+    )
+    assert resp_a.status_code == 200, resp_a.text
+    assert resp_b.status_code == 200, resp_b.text
+    alias_a1 = resp_a.json()["alias"]
+    project_id_a = resp_a.json()["project_id"]
+    alias_b1 = resp_b.json()["alias"]
+    project_id_b = resp_b.json()["project_id"]
+
+    # Both should get the first name prefix (e.g., "alice-agent")
+    # because their alias pools are independent
+    assert alias_a1 == alias_b1, (
+        f"Expected same alias prefix for first agent in each project, "
+        f"got {alias_a1!r} vs {alias_b1!r}"
+    )
 
-            # Project IDs should match what we pre-created
-            assert project_id_a == pid_a
-            assert project_id_b == pid_b
+    # Project IDs should match what we pre-created
+    assert project_id_a == pid_a
+    assert project_id_b == pid_b
 
-            # They should be different aweb projects
-            assert pid_a != pid_b
+    # They should be different aweb projects
+    assert pid_a != pid_b
 
 
-@pytest.mark.asyncio
-async def test_init_without_project_id_still_works(db_infra, redis_client_async):
+async def test_init_without_project_id_still_works(shared_client):
     """OSS mode: /v1/init without project_id works as before."""
-    slug = f"oss-{uuid.uuid4().hex[:8]}"
-
-    app = create_app(db_infra=db_infra, redis=redis_client_async, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            resp = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": slug,
-                    "project_name": slug,
-                    "human_name": "OSS Agent",
-                    "agent_type": "agent",
-                    "repo_origin": f"git@github.com:test/{slug}.git",
-                    "role": "agent",
-                },
-            )
-            assert resp.status_code == 200, resp.text
-            data = resp.json()
-            assert data["alias"]  # Got an alias
-            assert data["project_id"]  # Got a project ID
-            assert data["workspace_id"]  # Got a workspace
+    slug = uniq("oss")
+
+    resp = await shared_client.post(
+        "/v1/init",
+        json=_init_payload(
+            slug,
+            human_name="OSS Agent",
+            repo_origin=f"git@github.com:test/{slug}.git",
+            role="agent",
+        ),
+    )
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["alias"]  # Got an alias
+    assert data["project_id"]  # Got a project ID
+    assert data["workspace_id"]  # Got a workspace
 
 
-@pytest.mark.asyncio
-async def test_init_with_project_id_uses_existing_server_project(db_infra, redis_client_async):
+async def test_init_with_project_id_uses_existing_server_project(shared_client, shared_db_infra):
     """When project_id is provided, the returned project_id matches it."""
-    slug = f"cloud-{uuid.uuid4().hex[:8]}"
+    slug = uniq("cloud")
     tenant_id = str(uuid.uuid4())
-    pre_created_pid = await _pre_create_project(db_infra, slug=slug, tenant_id=tenant_id)
-
-    app = create_app(db_infra=db_infra, redis=redis_client_async, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            resp = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": slug,
-                    "project_id": pre_created_pid,
-                    "project_name": slug,
-                    "human_name": "Cloud Agent",
-                    "agent_type": "agent",
-                    "repo_origin": f"git@github.com:test/{slug}.git",
-                    "role": "agent",
-                },
-            )
-            assert resp.status_code == 200, resp.text
-            assert resp.json()["project_id"] == pre_created_pid
+    pre_created_pid = await _pre_create_project(shared_db_infra, slug=slug, tenant_id=tenant_id)
+
+    resp = await shared_client.post(
+        "/v1/init",
+        json=_init_payload(
+            slug,
+            project_id=pre_created_pid,
+            human_name="Cloud Agent",
+            repo_origin=f"git@github.com:test/{slug}.git",
+            role="agent",
+        ),
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["project_id"] == pre_created_pid
 
 
-@pytest.mark.asyncio
-async def test_init_with_unknown_project_id_returns_404(db_infra, redis_client_async):
+async def test_init_with_unknown_project_id_returns_404(shared_client, shared_db_infra):
     """Passing a project_id that doesn't exist in server.projects returns 404."""
-    slug = f"ghost-{uuid.uuid4().hex[:8]}"
+    slug = uniq("ghost")
     fake_pid = str(uuid.uuid4())
-
-    app = create_app(db_infra=db_infra, redis=redis_client_async, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            resp = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": slug,
-                    "project_id": fake_pid,
-                    "project_name": slug,
-                    "human_name": "Ghost Agent",
-                    "agent_type": "agent",
-                },
-            )
-            assert resp.status_code == 404, resp.text
-            assert "project_not_found" in resp.json()["detail"]
+    # Precondition: nothing in server.projects has this id.
+    server_db = shared_db_infra.get_manager("server")
+    row = await server_db.fetch_one(
+        "SELECT id FROM {{tables.projects}} WHERE id = $1", uuid.UUID(fake_pid)
+    )
+    assert row is None
+
+    resp = await shared_client.post(
+        "/v1/init",
+        json=_init_payload(
+            slug,
+            project_id=fake_pid,
+            human_name="Ghost Agent",
+        ),
+    )
+    assert resp.status_code == 404, resp.text
+    assert "project_not_found" in resp.json()["detail"]
 
 
-@pytest.mark.asyncio
-async def test_init_with_project_id_without_repo_origin(db_infra, redis_client_async):
+async def test_init_with_project_id_without_repo_origin(shared_client, shared_db_infra):
     """Cloud init with project_id but no repo_origin returns identity without workspace."""
-    slug = f"norep-{uuid.uuid4().hex[:8]}"
+    slug = uniq("norep")
     tenant_id = str(uuid.uuid4())
-    pre_created_pid = await _pre_create_project(db_infra, slug=slug, tenant_id=tenant_id)
-
-    app = create_app(db_infra=db_infra, redis=redis_client_async, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            resp = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": slug,
-                    "project_id": pre_created_pid,
-                    "project_name": slug,
-                    "alias": "alice",
-                    "human_name": "Cloud Agent",
-                    "agent_type": "agent",
-                },
-            )
-            assert resp.status_code == 200, resp.text
-            data = resp.json()
-            assert data["project_id"] == pre_created_pid
-            assert data["alias"] == "alice"
-            assert data["workspace_id"] is None
-            assert data["repo_id"] is None
+    pre_created_pid = await _pre_create_project(shared_db_infra, slug=slug, tenant_id=tenant_id)
+
+    resp = await shared_client.post(
+        "/v1/init",
+        json=_init_payload(
+            slug,
+            project_id=pre_created_pid,
+            alias="alice",
+            human_name="Cloud Agent",
+        ),
+    )
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["project_id"] == pre_created_pid
+    assert data["alias"] == "alice"
+    assert data["workspace_id"] is None
+    assert data["repo_id"] is None
 
 
-@pytest.mark.asyncio
-async def test_init_with_project_id_second_agent_independent(db_infra, redis_client_async):
+async def test_init_with_project_id_second_agent_independent(shared_client, shared_db_infra):
     """Adding a second agent to project A doesn't affect project B's alias pool."""
-    slug = f"indep-{uuid.uuid4().hex[:8]}"
+    slug = uniq("indep")
     tenant_a = str(uuid.uuid4())
     tenant_b = str(uuid.uuid4())
 
-    pid_a = await _pre_create_project(db_infra, slug=slug, tenant_id=tenant_a)
-    pid_b = await _pre_create_project(db_infra, slug=slug, tenant_id=tenant_b)
-
-    app = create_app(db_infra=db_infra, redis=redis_client_async, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            # Create two agents in project A
-            for i in range(2):
-                resp = await client.post(
-                    "/v1/init",
-                    json={
-                        "project_slug": slug,
-                        "project_id": pid_a,
-                        "project_name": slug,
-                        "human_name": f"Agent A{i+1}",
-                        "agent_type": "agent",
-                        "repo_origin": f"git@github.com:test/{slug}-a{i}.git",
-                        "role": "agent",
-                    },
-                )
-                assert resp.status_code == 200, resp.text
-
-            # Now create first agent in project B — should still get first alias
-            resp_b = await client.post(
+    pid_a, pid_b = await _pre_create_projects(shared_db_infra, [(slug, tenant_a), (slug, tenant_b)])
+
+    # Create two agents in project A
+    for i in range(2):
+        resp = await shared_client.post(
+            "/v1/init",
+            json=_init_payload(
+                slug,
+                project_id=pid_a,
+                human_name=f"Agent A{i+1}",
+                repo_origin=f"git@github.com:test/{slug}-a{i}.git",
+                role="agent",
+            ),
+        )
+        assert resp.status_code == 200, resp.text
+
+    # Now create first agent in project B — should still get first alias.
+    # Kept after A's agents on purpose: the point is that A's pool has advanced.
+    resp_b = await shared_client.post(
+        "/v1/init",
+        json=_init_payload(
+            slug,
+            project_id=pid_b,
+            human_name="Agent B1",
+            repo_origin=f"git@github.com:test/{slug}-b.git",
+            role="agent",
+        ),
+    )
+    assert resp_b.status_code == 200, resp_b.text
+
+    # B's first agent should get the first name prefix, unaffected by A's agents
+    alias_b = resp_b.json()["alias"]
+    # The first alias from CLASSIC_NAMES with "-agent" suffix
+    assert alias_b.endswith("-agent"), f"Expected '-agent' suffix, got {alias_b!r}"
+    # Verify it's the first name (not the third), proving pool independence
+    assert alias_b.startswith(
+        CLASSIC_NAMES[0]
+    ), f"Expected alias starting with {CLASSIC_NAMES[0]!r}, got {alias_b!r}"
+
+
+async def test_concurrent_first_inits_agree_on_active_policy(shared_client, shared_db_infra):
+    """Agents starting at once on a new project all get the same active policy id.
+
+    Each first init bootstraps the default policy; only one version may win.
+    The project is pre-created so the inits race on the policy, not the project.
+    """
+    slug = uniq("policy-race")
+    project_id = await _pre_create_project(shared_db_infra, slug=slug, tenant_id=str(uuid.uuid4()))
+    repo_origin = f"git@github.com:test/{slug}.git"
+
+    responses = await asyncio.gather(
+        *(
+            shared_client.post(
                 "/v1/init",
-                json={
-                    "project_slug": slug,
-                    "project_id": pid_b,
-                    "project_name": slug,
-                    "human_name": "Agent B1",
-                    "agent_type": "agent",
-                    "repo_origin": f"git@github.com:test/{slug}-b.git",
-                    "role": "agent",
-                },
+                json=_init_payload(
+                    slug,
+                    project_id=project_id,
+                    alias=f"agent-{i}",
+                    human_name=f"Agent {i}",
+                    repo_origin=repo_origin,
+                    role="agent",
+                ),
             )
-            assert resp_b.status_code == 200, resp_b.text
-
-            # B's first agent should get the first name prefix, unaffected by A's agents
-            alias_b = resp_b.json()["alias"]
-            # The first alias from CLASSIC_NAMES with "-agent" suffix
-            assert alias_b.endswith("-agent"), f"Expected '-agent' suffix, got {alias_b!r}"
-            # Verify it's the first name (not the third), proving pool independence
-            from beadhub.names import CLASSIC_NAMES
-
-            assert alias_b.startswith(
-                CLASSIC_NAMES[0]
-            ), f"Expected alias starting with {CLASSIC_NAMES[0]!r}, got {alias_b!r}"
+            for i in range(2)
+        )
+    )
+    for resp in responses:
+        assert resp.status_code == 200, resp.text
+    first, second = (resp.json() for resp in responses)
+    assert first["active_policy_id"]
+    assert second["active_policy_id"] == first["active_policy_id"]
+
+    active = await shared_client.get("/v1/policies/active", headers=auth_headers(first["api_key"]))
+    assert active.status_code == 200, active.text
+    assert active.json()["policy_id"] == first["active_policy_id"]
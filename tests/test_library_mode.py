@@ -1,7 +1,6 @@
 """Test library mode: create_app() with external DB and Redis connections."""
 
 import asyncio
-import os
 import uuid
 
 import pytest
@@ -13,11 +12,13 @@ from redis.asyncio import Redis
 from beadhub.api import create_app
 from beadhub.db import DatabaseInfra
 
+from .conftest import TEST_REDIS_URL
+
 
 @pytest.fixture
 def redis_url():
     """Return test Redis URL."""
-    return os.getenv("BEADHUB_TEST_REDIS_URL", "redis://localhost:6379/15")
+    return TEST_REDIS_URL
 
 
 @pytest.mark.asyncio
@@ -103,7 +104,7 @@ async def test_library_mode_validation():
         create_app(db_infra=DatabaseInfra())
 
     # Only redis provided - should fail
-    redis = await Redis.from_url("redis://localhost:6379/15", decode_responses=True)
+    redis = await Redis.from_url(TEST_REDIS_URL, decode_responses=True)
     try:
         with pytest.raises(ValueError, match="Library mode requires both"):
             create_app(redis=redis)
@@ -1,5 +1,8 @@
 """Tests for pagination helper module."""
 
+import base64
+import re
+
 import pytest
 from pydantic import BaseModel
 
@@ -13,6 +16,13 @@ from beadhub.pagination import (
     validate_pagination_params,
 )
 
+# One byte over the limit; built once at import.
+_OVERSIZED_CURSOR = "a" * (MAX_CURSOR_SIZE_BYTES + 1)
+
+_INVALID_CURSOR_RE = re.compile("Invalid cursor")
+_NOT_DICT_RE = re.compile("must decode to a dictionary")
+_OVERSIZED_RE = re.compile("exceeds maximum size")
+
 
 class TestCursorEncoding:
     """Tests for cursor encoding/decoding."""
@@ -23,12 +33,28 @@ class TestCursorEncoding:
         assert isinstance(cursor, str)
         assert len(cursor) > 0
 
-    def test_decode_cursor_reverses_encode(self):
-        """decode_cursor should reverse encode_cursor."""
-        data = {"id": "abc123", "timestamp": "2025-01-01T00:00:00Z"}
-        cursor = encode_cursor(data)
-        decoded = decode_cursor(cursor)
-        assert decoded == data
+    @pytest.mark.parametrize(
+        "data",
+        [
+            pytest.param({"id": "abc123", "timestamp": "2025-01-01T00:00:00Z"}, id="basic"),
+            pytest.param(
+                {
+                    "string": "hello",
+                    "int": 42,
+                    "float": 3.14,
+                    "bool": True,
+                    "null": None,
+                    "list": [1, 2, 3],
+                },
+                id="mixed-types",
+            ),
+            pytest.param({}, id="empty"),
+            pytest.param({"user": "用户", "emoji": "🎉", "special": "café"}, id="unicode"),
+        ],
+    )
+    def test_decode_cursor_reverses_encode(self, data):
+        """decode_cursor should reverse encode_cursor for any JSON-serializable dict."""
+        assert decode_cursor(encode_cursor(data)) == data
 
     def test_encode_cursor_is_url_safe(self):
         """Encoded cursor should be URL-safe (no +, /, =)."""
@@ -40,15 +66,13 @@ class TestCursorEncoding:
 
     def test_decode_cursor_invalid_format(self):
         """decode_cursor should raise ValueError for invalid format."""
-        with pytest.raises(ValueError, match="Invalid cursor"):
+        with pytest.raises(ValueError, match=_INVALID_CURSOR_RE):
             decode_cursor("not-valid-base64!!!")
 
     def test_decode_cursor_invalid_json(self):
         """decode_cursor should raise ValueError for invalid JSON in cursor."""
-        import base64
-
         invalid_json = base64.urlsafe_b64encode(b"not json").decode()
-        with pytest.raises(ValueError, match="Invalid cursor"):
+        with pytest.raises(ValueError, match=_INVALID_CURSOR_RE):
             decode_cursor(invalid_json)
 
     def test_decode_cursor_none(self):
@@ -59,54 +83,22 @@ class TestCursorEncoding:
         """decode_cursor should return None for empty string."""
         assert decode_cursor("") is None
 
-    def test_encode_cursor_handles_various_types(self):
-        """encode_cursor should handle various JSON-serializable types."""
-        data = {
-            "string": "hello",
-            "int": 42,
-            "float": 3.14,
-            "bool": True,
-            "null": None,
-            "list": [1, 2, 3],
-        }
-        cursor = encode_cursor(data)
-        decoded = decode_cursor(cursor)
-        assert decoded == data
-
-    def test_encode_decode_empty_dict(self):
-        """Empty dict should encode and decode correctly."""
-        data = {}
-        cursor = encode_cursor(data)
-        decoded = decode_cursor(cursor)
-        assert decoded == {}
-
-    def test_encode_cursor_handles_unicode(self):
-        """encode_cursor should handle non-ASCII characters."""
-        data = {"user": "用户", "emoji": "🎉", "special": "café"}
-        cursor = encode_cursor(data)
-        decoded = decode_cursor(cursor)
-        assert decoded == data
-
     def test_decode_cursor_rejects_non_dict(self):
         """decode_cursor should reject valid JSON that isn't a dict."""
-        import base64
-
         # Encode a list instead of dict
         list_cursor = base64.urlsafe_b64encode(b"[1, 2, 3]").decode()
-        with pytest.raises(ValueError, match="must decode to a dictionary"):
+        with pytest.raises(ValueError, match=_NOT_DICT_RE):
             decode_cursor(list_cursor)
 
         # Encode a string
         string_cursor = base64.urlsafe_b64encode(b'"just a string"').decode()
-        with pytest.raises(ValueError, match="must decode to a dictionary"):
+        with pytest.raises(ValueError, match=_NOT_DICT_RE):
             decode_cursor(string_cursor)
 
     def test_decode_cursor_rejects_oversized_cursor(self):
         """decode_cursor should reject cursors exceeding MAX_CURSOR_SIZE_BYTES."""
-        # Create a cursor that's too large
-        oversized = "a" * (MAX_CURSOR_SIZE_BYTES + 1)
-        with pytest.raises(ValueError, match="exceeds maximum size"):
-            decode_cursor(oversized)
+        with pytest.raises(ValueError, match=_OVERSIZED_RE):
+            decode_cursor(_OVERSIZED_CURSOR)
 
 
 class TestValidatePaginationParams:
@@ -149,7 +141,7 @@ class TestValidatePaginationParams:
 
     def test_invalid_cursor_raises_error(self):
         """Invalid cursor should raise ValueError."""
-        with pytest.raises(ValueError, match="Invalid cursor"):
+        with pytest.raises(ValueError, match=_INVALID_CURSOR_RE):
             validate_pagination_params(10, "bad-cursor!!!")
 
 
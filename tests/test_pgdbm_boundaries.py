@@ -3,11 +3,9 @@ from __future__ import annotations
 from pathlib import Path
 
 
-def _read_sql_files(root: Path) -> list[tuple[Path, str]]:
-    files: list[tuple[Path, str]] = []
-    for path in sorted(root.rglob("*.sql")):
-        files.append((path, path.read_text(encoding="utf-8")))
-    return files
+def _sql_files_containing(root: Path, token: bytes) -> list[Path]:
+    """Return the .sql files under ``root`` whose raw bytes contain ``token``."""
+    return [path for path in root.rglob("*.sql") if token in path.read_bytes()]
 
 
 def test_beadhub_migrations_do_not_reference_aweb_schema() -> None:
@@ -20,5 +18,5 @@ def test_beadhub_migrations_do_not_reference_aweb_schema() -> None:
     repo_root = Path(__file__).resolve().parents[1]
     beadhub_migrations = repo_root / "src" / "beadhub" / "migrations"
 
-    for path, content in _read_sql_files(beadhub_migrations):
-        assert "aweb." not in content, f"{path} contains a cross-boundary aweb schema reference"
+    offenders = _sql_files_containing(beadhub_migrations, b"aweb.")
+    assert not offenders, f"cross-boundary aweb schema references in: {sorted(offenders)}"
@@ -15,30 +15,22 @@ async def test_pgdbm_schema_migrations_module_names_are_stable(db_infra):
     - aweb schema via module_name 'aweb-aweb'
     """
 
-    server_db = db_infra.get_manager("server")
-    beads_db = db_infra.get_manager("beads")
-    aweb_db = db_infra.get_manager("aweb")
-
-    server_names = {
-        r["module_name"]
-        for r in await server_db.fetch_all(
-            "SELECT DISTINCT module_name FROM server.schema_migrations"
-        )
-        if r.get("module_name")
-    }
-    beads_names = {
-        r["module_name"]
-        for r in await beads_db.fetch_all(
-            "SELECT DISTINCT module_name FROM beads.schema_migrations"
-        )
-        if r.get("module_name")
-    }
-    aweb_names = {
-        r["module_name"]
-        for r in await aweb_db.fetch_all("SELECT DISTINCT module_name FROM aweb.schema_migrations")
-        if r.get("module_name")
-    }
-
-    assert "beadhub-server" in server_names
-    assert "beadhub-beads" in beads_names
-    assert "aweb-aweb" in aweb_names
+    # All three schemas live in one database behind a shared pool, so a single
+    # query covers them.
+    rows = await db_infra.get_manager("server").fetch_all(
+        """
+        SELECT 'server' AS src, module_name FROM server.schema_migrations
+        UNION ALL
+        SELECT 'beads', module_name FROM beads.schema_migrations
+        UNION ALL
+        SELECT 'aweb', module_name FROM aweb.schema_migrations
+        """
+    )
+    names: dict[str, set[str]] = {"server": set(), "beads": set(), "aweb": set()}
+    for r in rows:
+        if name := r["module_name"]:
+            names[r["src"]].add(name)
+
+    assert "beadhub-server" in names["server"]
+    assert "beadhub-beads" in names["beads"]
+    assert "aweb-aweb" in names["aweb"]
@@ -1,14 +1,19 @@
 """Tests for project policy storage and bootstrap."""
 
+import asyncio
 import json
 import uuid
-from pathlib import Path
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from typing import Any
 
 import asyncpg
+import httpx
 import pytest
+import pytest_asyncio
+from fastapi import HTTPException
 from pgdbm import AsyncDatabaseManager
 from pgdbm.errors import QueryError
-from pgdbm.migrations import AsyncMigrationManager
 
 from beadhub.routes.policies import (
     DEFAULT_POLICY_BUNDLE,
@@ -17,37 +22,44 @@ from beadhub.routes.policies import (
     get_active_policy,
 )
 
+from .conftest import uniq
 
-async def _setup_server_schema(db: AsyncDatabaseManager) -> None:
-    """Apply server migrations to the test database."""
-    root = Path(__file__).resolve().parents[1]
-    migrations_path = root / "src" / "beadhub" / "migrations" / "server"
+# Shared by tests that only need some valid bundle; treat it as read-only.
+_EMPTY_BUNDLE: dict[str, Any] = {"invariants": [], "roles": {}, "adapters": {}}
+# Serialized once: as a bundle_json parameter and as a POST /v1/policies body.
+_EMPTY_BUNDLE_JSON = json.dumps(_EMPTY_BUNDLE)
+_EMPTY_BUNDLE_BODY = json.dumps({"bundle": _EMPTY_BUNDLE}).encode()
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+# Well-formed policy id that never exists.
+_ZERO_UUID = "00000000-0000-0000-0000-000000000000"
+_ZERO_POLICY_URL = f"/v1/policies/{_ZERO_UUID}"
 
-    manager = AsyncMigrationManager(
-        db,
-        migrations_path=str(migrations_path),
-        module_name="beadhub-server-test",
-    )
-    await manager.apply_pending_migrations()
 
+@pytest.fixture(scope="module")
+def server_db(shared_db_infra) -> AsyncDatabaseManager:
+    """Server-schema manager on the session database, migrated once per session.
 
-@pytest.mark.asyncio
-async def test_project_policies_migration(test_db_with_schema):
-    """Verify project_policies table is created with correct structure."""
-    await _setup_server_schema(test_db_with_schema)
+    Tests share the schema, so each one creates its own uniquely-named projects
+    and only asserts on rows belonging to them.
+    """
+    return shared_db_infra.get_manager("server")
 
-    # Create a project
-    project_id = str(uuid.uuid4())
-    await test_db_with_schema.execute(
-        "INSERT INTO {{tables.projects}} (id, slug, name) VALUES ($1, $2, $3)",
-        project_id,
-        "test-project",
-        "Test Project",
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def project_id(server_db) -> str:
+    """Id of a fresh, policy-less project for tests that only need one that exists."""
+    row = await server_db.fetch_one(
+        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
+        uniq("test-project"),
     )
+    return str(row["id"])
 
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_project_policies_migration(server_db, project_id):
+    """Verify project_policies table is created with correct structure."""
     # Insert a policy
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-    result = await test_db_with_schema.fetch_one(
+    result = await server_db.fetch_one(
         """
         INSERT INTO {{tables.project_policies}} (project_id, version, bundle_json)
         VALUES ($1, $2, $3::jsonb)
@@ -55,7 +67,7 @@ async def test_project_policies_migration(test_db_with_schema):
         """,
         project_id,
         1,
-        json.dumps(bundle),
+        _EMPTY_BUNDLE_JSON,
     )
 
     assert result is not None
@@ -64,107 +76,86 @@ async def test_project_policies_migration(test_db_with_schema):
     assert result["updated_at"] is not None
 
 
-@pytest.mark.asyncio
-async def test_policy_version_unique_constraint(test_db_with_schema):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_policy_version_unique_constraint(server_db, project_id):
     """Verify version numbers are unique per project."""
-    await _setup_server_schema(test_db_with_schema)
-
-    project_id = str(uuid.uuid4())
-    await test_db_with_schema.execute(
-        "INSERT INTO {{tables.projects}} (id, slug, name) VALUES ($1, $2, $3)",
-        project_id,
-        "test-project",
-        "Test Project",
-    )
-
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-
     # Insert version 1
-    await test_db_with_schema.execute(
+    await server_db.execute(
         """
         INSERT INTO {{tables.project_policies}} (project_id, version, bundle_json)
         VALUES ($1, $2, $3::jsonb)
         """,
         project_id,
         1,
-        json.dumps(bundle),
+        _EMPTY_BUNDLE_JSON,
     )
 
     # Duplicate version should fail
     with pytest.raises(QueryError) as exc_info:
-        await test_db_with_schema.execute(
+        await server_db.execute(
             """
             INSERT INTO {{tables.project_policies}} (project_id, version, bundle_json)
             VALUES ($1, $2, $3::jsonb)
             """,
             project_id,
             1,
-            json.dumps(bundle),
+            _EMPTY_BUNDLE_JSON,
         )
     assert isinstance(exc_info.value.__cause__, asyncpg.UniqueViolationError)
 
 
-@pytest.mark.asyncio
-async def test_policy_version_unique_per_project(test_db_with_schema):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_policy_version_unique_per_project(server_db):
     """Verify same version number allowed in different projects."""
-    await _setup_server_schema(test_db_with_schema)
-
     project_1 = str(uuid.uuid4())
     project_2 = str(uuid.uuid4())
 
-    await test_db_with_schema.execute(
+    await server_db.execute(
         "INSERT INTO {{tables.projects}} (id, slug) VALUES ($1, $2), ($3, $4)",
         project_1,
-        "project-1",
+        uniq("project-1"),
         project_2,
-        "project-2",
+        uniq("project-2"),
     )
 
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-
     # Version 1 in project 1
-    await test_db_with_schema.execute(
+    await server_db.execute(
         """
         INSERT INTO {{tables.project_policies}} (project_id, version, bundle_json)
         VALUES ($1, $2, $3::jsonb)
         """,
         project_1,
         1,
-        json.dumps(bundle),
+        _EMPTY_BUNDLE_JSON,
     )
 
     # Version 1 in project 2 should succeed
-    await test_db_with_schema.execute(
+    await server_db.execute(
         """
         INSERT INTO {{tables.project_policies}} (project_id, version, bundle_json)
         VALUES ($1, $2, $3::jsonb)
         """,
         project_2,
         1,
-        json.dumps(bundle),
+        _EMPTY_BUNDLE_JSON,
     )
 
     # Verify both exist
-    count = await test_db_with_schema.fetch_value(
-        "SELECT COUNT(*) FROM {{tables.project_policies}} WHERE version = 1"
+    count = await server_db.fetch_value(
+        """
+        SELECT COUNT(*) FROM {{tables.project_policies}}
+        WHERE version = 1 AND project_id IN ($1, $2)
+        """,
+        project_1,
+        project_2,
     )
     assert count == 2
 
 
-@pytest.mark.asyncio
-async def test_active_policy_fk(test_db_with_schema):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_active_policy_fk(server_db, project_id):
     """Verify active_policy_id FK works correctly."""
-    await _setup_server_schema(test_db_with_schema)
-
-    project_id = str(uuid.uuid4())
-    await test_db_with_schema.execute(
-        "INSERT INTO {{tables.projects}} (id, slug) VALUES ($1, $2)",
-        project_id,
-        "test-project",
-    )
-
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-    policy = await test_db_with_schema.fetch_one(
+    policy = await server_db.fetch_one(
         """
         INSERT INTO {{tables.project_policies}} (project_id, version, bundle_json)
         VALUES ($1, $2, $3::jsonb)
@@ -172,78 +163,54 @@ async def test_active_policy_fk(test_db_with_schema):
         """,
         project_id,
         1,
-        json.dumps(bundle),
+        _EMPTY_BUNDLE_JSON,
     )
 
     # Set active policy
-    await test_db_with_schema.execute(
+    await server_db.execute(
         "UPDATE {{tables.projects}} SET active_policy_id = $2 WHERE id = $1",
         project_id,
         policy["policy_id"],
     )
 
     # Verify it was set
-    result = await test_db_with_schema.fetch_one(
+    result = await server_db.fetch_one(
         "SELECT active_policy_id FROM {{tables.projects}} WHERE id = $1",
         project_id,
     )
     assert result["active_policy_id"] == policy["policy_id"]
 
 
-@pytest.mark.asyncio
-async def test_policy_cascade_on_project_delete(test_db_with_schema):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_policy_cascade_on_project_delete(server_db, project_id):
     """Verify policies are deleted when project is deleted."""
-    await _setup_server_schema(test_db_with_schema)
-
-    project_id = str(uuid.uuid4())
-    await test_db_with_schema.execute(
-        "INSERT INTO {{tables.projects}} (id, slug) VALUES ($1, $2)",
-        project_id,
-        "test-project",
-    )
-
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-    await test_db_with_schema.execute(
+    await server_db.execute(
         """
         INSERT INTO {{tables.project_policies}} (project_id, version, bundle_json)
         VALUES ($1, $2, $3::jsonb)
         """,
         project_id,
         1,
-        json.dumps(bundle),
+        _EMPTY_BUNDLE_JSON,
     )
 
     # Delete project
-    await test_db_with_schema.execute(
+    await server_db.execute(
         "DELETE FROM {{tables.projects}} WHERE id = $1",
         project_id,
     )
 
     # Policies should be gone
-    count = await test_db_with_schema.fetch_value(
+    count = await server_db.fetch_value(
         "SELECT COUNT(*) FROM {{tables.project_policies}} WHERE project_id = $1",
         project_id,
     )
     assert count == 0
 
 
-@pytest.mark.asyncio
-async def test_create_policy_version(db_infra):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_policy_version(server_db, project_id):
     """Test create_policy_version helper function."""
-    server_db = db_infra.get_manager("server")
-
-    # Create a project
-    project = await server_db.fetch_one(
-        """
-        INSERT INTO {{tables.projects}} (slug, name)
-        VALUES ($1, $2)
-        RETURNING id
-        """,
-        "test-project",
-        "Test Project",
-    )
-    project_id = str(project["id"])
-
     # Create first version
     bundle = {"invariants": [{"id": "test", "title": "Test", "body_md": "Test body"}]}
     policy_v1 = await create_policy_version(
@@ -273,13 +240,9 @@ async def test_create_policy_version(db_infra):
     assert policy_v2.version == 2
 
 
-@pytest.mark.asyncio
-async def test_create_policy_version_nonexistent_project(db_infra):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_policy_version_nonexistent_project(server_db):
     """Test create_policy_version fails for nonexistent project."""
-    from fastapi import HTTPException
-
-    server_db = db_infra.get_manager("server")
-
     with pytest.raises(HTTPException) as exc_info:
         await create_policy_version(
             server_db,
@@ -291,23 +254,9 @@ async def test_create_policy_version_nonexistent_project(db_infra):
     assert exc_info.value.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_activate_policy(db_infra):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_activate_policy(server_db, project_id):
     """Test activate_policy helper function."""
-    server_db = db_infra.get_manager("server")
-
-    # Create a project
-    project = await server_db.fetch_one(
-        """
-        INSERT INTO {{tables.projects}} (slug, name)
-        VALUES ($1, $2)
-        RETURNING id
-        """,
-        "test-project",
-        "Test Project",
-    )
-    project_id = str(project["id"])
-
     # Create a policy
     policy = await create_policy_version(
         server_db,
@@ -333,21 +282,15 @@ async def test_activate_policy(db_infra):
     assert str(row["active_policy_id"]) == policy.policy_id
 
 
-@pytest.mark.asyncio
-async def test_activate_policy_wrong_project(db_infra):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_activate_policy_wrong_project(server_db):
     """Test activate_policy fails for policy from different project."""
-    from fastapi import HTTPException
-
-    server_db = db_infra.get_manager("server")
-
     # Create two projects
-    project_1 = await server_db.fetch_one(
-        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
-        "project-1",
-    )
-    project_2 = await server_db.fetch_one(
-        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
-        "project-2",
+    # Either project can play either role, so RETURNING order does not matter.
+    project_1, project_2 = await server_db.fetch_all(
+        "INSERT INTO {{tables.projects}} (slug) VALUES ($1), ($2) RETURNING id",
+        uniq("project-1"),
+        uniq("project-2"),
     )
 
     # Create policy in project 1
@@ -370,18 +313,9 @@ async def test_activate_policy_wrong_project(db_infra):
     assert "does not belong to this project" in exc_info.value.detail
 
 
-@pytest.mark.asyncio
-async def test_get_active_policy_bootstrap(db_infra):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_active_policy_bootstrap(server_db, project_id):
     """Test get_active_policy bootstraps default policy when none exists."""
-    server_db = db_infra.get_manager("server")
-
-    # Create a project with no policy
-    project = await server_db.fetch_one(
-        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
-        "test-project",
-    )
-    project_id = str(project["id"])
-
     # Get active policy - should bootstrap
     policy = await get_active_policy(server_db, project_id)
 
@@ -400,33 +334,29 @@ async def test_get_active_policy_bootstrap(db_infra):
     assert str(row["active_policy_id"]) == policy.policy_id
 
 
-@pytest.mark.asyncio
-async def test_get_active_policy_no_bootstrap(db_infra):
-    """Test get_active_policy returns None when bootstrap disabled."""
-    server_db = db_infra.get_manager("server")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_active_policy_concurrent_bootstrap(server_db, project_id):
+    """Concurrent first reads of a policy-less project all return the one activated policy."""
+    policies = await asyncio.gather(*(get_active_policy(server_db, project_id) for _ in range(4)))
 
-    project = await server_db.fetch_one(
-        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
-        "test-project",
+    row = await server_db.fetch_one(
+        "SELECT active_policy_id FROM {{tables.projects}} WHERE id = $1",
+        project_id,
     )
-    project_id = str(project["id"])
+    assert {policy.policy_id for policy in policies} == {str(row["active_policy_id"])}
+
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_active_policy_no_bootstrap(server_db, project_id):
+    """Test get_active_policy returns None when bootstrap disabled."""
     # Get without bootstrap
     policy = await get_active_policy(server_db, project_id, bootstrap_if_missing=False)
     assert policy is None
 
 
-@pytest.mark.asyncio
-async def test_get_active_policy_existing(db_infra):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_active_policy_existing(server_db, project_id):
     """Test get_active_policy returns existing active policy."""
-    server_db = db_infra.get_manager("server")
-
-    project = await server_db.fetch_one(
-        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
-        "test-project",
-    )
-    project_id = str(project["id"])
-
     # Create and activate a custom policy
     custom_bundle = {
         "invariants": [{"id": "custom", "title": "Custom", "body_md": "Custom policy"}],
@@ -451,19 +381,53 @@ async def test_get_active_policy_existing(db_infra):
     assert fetched.bundle.invariants[0]["id"] == "custom"
 
 
-@pytest.mark.asyncio
-async def test_policy_project_isolation(db_infra):
-    """Test policies are properly isolated between projects."""
-    server_db = db_infra.get_manager("server")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_active_policy_cache_invalidates(server_db, project_id):
+    """Repeat reads reuse the parsed bundle only while the active policy row is unchanged."""
+    # The project has no policy yet, so this read bootstraps the default one.
+    first = await get_active_policy(server_db, project_id)
+    assert first is not None
+    # The first read after a bootstrap is already served from the cache.
+    again = await get_active_policy(server_db, project_id)
+    assert again.policy_id == first.policy_id
+    assert again.bundle is first.bundle
+    # So is every later read while the row is unchanged.
+    third = await get_active_policy(server_db, project_id)
+    assert third.bundle is first.bundle
+
+    # Editing the active row bumps updated_at, so the next read re-parses it.
+    await server_db.execute(
+        "UPDATE {{tables.project_policies}} SET bundle_json = $2::jsonb WHERE policy_id = $1",
+        first.policy_id,
+        json.dumps({"invariants": [{"id": "edited", "title": "Edited", "body_md": "Edited"}]}),
+    )
+    edited = await get_active_policy(server_db, project_id)
+    assert edited.policy_id == first.policy_id
+    assert [inv["id"] for inv in edited.bundle.invariants] == ["edited"]
+
+    # Activating another version switches the cached entry too.
+    policy = await create_policy_version(
+        server_db,
+        project_id=project_id,
+        base_policy_id=None,
+        bundle={},
+        created_by_workspace_id=None,
+    )
+    await activate_policy(server_db, project_id=project_id, policy_id=policy.policy_id)
+    switched = await get_active_policy(server_db, project_id)
+    assert switched.policy_id == policy.policy_id
+    assert switched.bundle.invariants == []
+
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_policy_project_isolation(server_db):
+    """Test policies are properly isolated between projects."""
     # Create two projects
-    project_1 = await server_db.fetch_one(
-        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
-        "project-1",
-    )
-    project_2 = await server_db.fetch_one(
-        "INSERT INTO {{tables.projects}} (slug) VALUES ($1) RETURNING id",
-        "project-2",
+    # Either project can play either role, so RETURNING order does not matter.
+    project_1, project_2 = await server_db.fetch_all(
+        "INSERT INTO {{tables.projects}} (slug) VALUES ($1), ($2) RETURNING id",
+        uniq("project-1"),
+        uniq("project-2"),
     )
 
     # Bootstrap policies for both
@@ -475,8 +439,6 @@ async def test_policy_project_isolation(db_infra):
     assert policy_1.project_id != policy_2.project_id
 
     # Cross-project activation should fail
-    from fastapi import HTTPException
-
     with pytest.raises(HTTPException):
         await activate_policy(
             server_db,
@@ -488,54 +450,92 @@ async def test_policy_project_isolation(db_infra):
 # Integration tests for GET /v1/policies/active endpoint
 
 
-def _init_project(beadhub_server: str, slug: str) -> tuple[str, str]:
-    """Create a project/agent/api_key in aweb, then register a BeadHub workspace."""
-    import uuid
+def _init_request(slug: str) -> dict:
+    """/v1/init body creating a project/agent/api_key and its BeadHub workspace at once.
+
+    ``slug`` is only a prefix; the project gets a process-unique slug so reruns
+    against the same database and parallel xdist workers never share a project.
+    """
+    slug = uniq(slug)
+    return {
+        "project_slug": slug,
+        "project_name": slug,
+        "alias": uniq("init"),
+        "human_name": "Init User",
+        "agent_type": "agent",
+        "repo_origin": f"git@github.com:test/{slug}.git",
+        "role": "agent",
+    }
 
-    import httpx
 
-    aweb_resp = httpx.post(
-        f"{beadhub_server}/v1/init",
-        json={
-            "project_slug": slug,
-            "project_name": slug,
-            "alias": f"init-{uuid.uuid4().hex[:8]}",
-            "human_name": "Init User",
-            "agent_type": "agent",
-        },
-        timeout=10.0,
-    )
-    assert aweb_resp.status_code == 200, aweb_resp.text
-    api_key = aweb_resp.json()["api_key"]
-
-    repo_origin = f"git@github.com:test/{slug}-{uuid.uuid4().hex[:8]}.git"
-    reg = httpx.post(
-        f"{beadhub_server}/v1/workspaces/register",
-        json={"repo_origin": repo_origin, "role": "agent"},
-        headers={"Authorization": f"Bearer {api_key}"},
-        timeout=10.0,
-    )
-    assert reg.status_code == 200, reg.text
-    project_id = reg.json()["project_id"]
-    return project_id, api_key
+def _init_result(resp: httpx.Response) -> tuple[str, str]:
+    _assert_status(resp, 200)
+    data = resp.json()
+    assert data["workspace_id"], data
+    return data["project_id"], data["api_key"]
+
+
+def _init_project(http_client: httpx.Client, slug: str) -> tuple[str, str]:
+    """Create a project via /v1/init and return ``(project_id, api_key)``."""
+    return _init_result(http_client.post("/v1/init", json=_init_request(slug)))
+
+
+async def _init_project_async(client: httpx.AsyncClient, slug: str) -> tuple[str, str]:
+    """Awaitable ``_init_project``, so independent projects can be created concurrently."""
+    return _init_result(await client.post("/v1/init", json=_init_request(slug)))
 
 
 def _auth_headers(api_key: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {api_key}"}
 
 
-def test_get_active_policy_endpoint_happy_path(beadhub_server):
-    """Test GET /v1/policies/active returns active policy."""
-    import httpx
+def _assert_status(resp: httpx.Response, code: int) -> None:
+    """Check the status code, showing the body only if the check fails."""
+    assert resp.status_code == code, resp.text
+
+
+@dataclass(frozen=True)
+class ProjectCtx:
+    project_id: str
+    api_key: str
+    active_policy_id: str
+
+
+@pytest.fixture
+def project_ctx(http_client: httpx.Client) -> Callable[[str], ProjectCtx]:
+    """Factory: init a fresh project; /v1/init also reports its bootstrapped policy id."""
+
+    def _project_ctx(slug: str) -> ProjectCtx:
+        resp = http_client.post("/v1/init", json=_init_request(slug))
+        project_id, api_key = _init_result(resp)
+        return ProjectCtx(project_id, api_key, resp.json()["active_policy_id"])
+
+    return _project_ctx
+
+
+@pytest.fixture(scope="module")
+def read_only_project(
+    http_client: httpx.Client, beadhub_server: str
+) -> Generator[tuple[str, httpx.Client], None, None]:
+    """(project_id, authenticated client) shared by tests that only read the bootstrapped policy.
 
-    project_id, api_key = _init_project(beadhub_server, "test-policy-project")
+    Tests using it must not create or activate policies; requests that are
+    rejected without changing anything (e.g. unknown policy ids) are fine.
+    """
+    project_id, api_key = _init_project(http_client, "test-readonly-policy")
+    with httpx.Client(
+        base_url=beadhub_server, headers=_auth_headers(api_key), timeout=10.0
+    ) as client:
+        yield project_id, client
+
+
+def test_get_active_policy_endpoint_happy_path(read_only_project):
+    """Test GET /v1/policies/active returns active policy."""
+    project_id, client = read_only_project
 
     # Get active policy
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
-    )
-    assert resp.status_code == 200
+    resp = client.get("/v1/policies/active")
+    _assert_status(resp, 200)
 
     data = resp.json()
     assert data["project_id"] == project_id
@@ -550,19 +550,16 @@ def test_get_active_policy_endpoint_happy_path(beadhub_server):
     assert "ETag" in resp.headers
 
 
-def test_get_active_policy_endpoint_with_role_selection(beadhub_server):
+def test_get_active_policy_endpoint_with_role_selection(read_only_project):
     """Test GET /v1/policies/active with role selection."""
-    import httpx
-
-    project_id, api_key = _init_project(beadhub_server, "test-role-project")
+    _project_id, client = read_only_project
 
     # Get with role selection
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
+    resp = client.get(
+        "/v1/policies/active",
         params={"role": "coordinator"},
     )
-    assert resp.status_code == 200
+    _assert_status(resp, 200)
 
     data = resp.json()
     assert "selected_role" in data
@@ -572,19 +569,16 @@ def test_get_active_policy_endpoint_with_role_selection(beadhub_server):
     assert len(data["roles"]) == len(DEFAULT_POLICY_BUNDLE["roles"])
 
 
-def test_get_active_policy_endpoint_only_selected(beadhub_server):
+def test_get_active_policy_endpoint_only_selected(read_only_project):
     """Test GET /v1/policies/active with only_selected=true."""
-    import httpx
-
-    project_id, api_key = _init_project(beadhub_server, "test-only-selected")
+    _project_id, client = read_only_project
 
     # Get with only_selected
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
+    resp = client.get(
+        "/v1/policies/active",
         params={"role": "reviewer", "only_selected": "true"},
     )
-    assert resp.status_code == 200
+    _assert_status(resp, 200)
 
     data = resp.json()
     # Only reviewer role should be present
@@ -593,86 +587,72 @@ def test_get_active_policy_endpoint_only_selected(beadhub_server):
     assert data["selected_role"]["role"] == "reviewer"
 
 
-def test_get_active_policy_endpoint_invalid_role(beadhub_server):
+def test_get_active_policy_endpoint_invalid_role(read_only_project):
     """Test GET /v1/policies/active with invalid role returns 400."""
-    import httpx
+    _project_id, client = read_only_project
 
-    _project_id, api_key = _init_project(beadhub_server, "test-invalid-role")
-
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
+    resp = client.get(
+        "/v1/policies/active",
         params={"role": "nonexistent"},
     )
-    assert resp.status_code == 400
+    _assert_status(resp, 400)
     assert "not found" in resp.json()["detail"]
     assert "Available roles" in resp.json()["detail"]
 
 
-def test_get_active_policy_endpoint_only_selected_requires_role(beadhub_server):
+def test_get_active_policy_endpoint_only_selected_requires_role(read_only_project):
     """Test only_selected=true without role returns 400."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-only-selected-no-role")
+    _project_id, client = read_only_project
 
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
+    resp = client.get(
+        "/v1/policies/active",
         params={"only_selected": "true"},
     )
-    assert resp.status_code == 400
+    _assert_status(resp, 400)
     assert "requires a role parameter" in resp.json()["detail"]
 
 
-def test_get_active_policy_endpoint_conditional_get_304(beadhub_server):
+def test_get_active_policy_endpoint_conditional_get_304(read_only_project):
     """Test conditional GET returns 304 when ETag matches."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-etag")
+    _project_id, client = read_only_project
 
     # First request to get ETag
-    resp1 = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
-    )
-    assert resp1.status_code == 200
+    resp1 = client.get("/v1/policies/active")
+    _assert_status(resp1, 200)
     etag = resp1.headers["ETag"]
 
     # Second request with If-None-Match
-    resp2 = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers={**_auth_headers(api_key), "If-None-Match": etag},
+    resp2 = client.get(
+        "/v1/policies/active",
+        headers={"If-None-Match": etag},
     )
-    assert resp2.status_code == 304
+    _assert_status(resp2, 304)
+    assert resp2.headers["ETag"] == etag
+    assert resp2.content == b""
 
 
-def test_get_active_policy_endpoint_missing_project_id(beadhub_server):
+def test_get_active_policy_endpoint_missing_project_id(http_client):
     """Test GET /v1/policies/active without auth returns 401."""
-    import httpx
-
-    resp = httpx.get(f"{beadhub_server}/v1/policies/active")
-    assert resp.status_code == 401
+    resp = http_client.get("/v1/policies/active")
+    _assert_status(resp, 401)
 
 
-def test_get_active_policy_endpoint_invalid_project_id(beadhub_server):
+def test_get_active_policy_endpoint_invalid_project_id(http_client):
     """Test GET /v1/policies/active with invalid Bearer token returns 401."""
-    import httpx
-
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
+    resp = http_client.get(
+        "/v1/policies/active",
         headers={"Authorization": "Bearer not-a-valid-key"},
     )
-    assert resp.status_code == 401
+    _assert_status(resp, 401)
 
 
 # Integration tests for admin endpoints (POST /v1/policies and POST /v1/policies/{id}/activate)
 
 
-def test_create_policy_endpoint(beadhub_server):
+def test_create_policy_endpoint(http_client, make_http_client):
     """Test POST /v1/policies creates a new policy version."""
-    import httpx
-
-    project_id, api_key = _init_project(beadhub_server, "test-create-policy")
+    project_id, api_key = _init_project(http_client, "test-create-policy")
+    client = make_http_client(_auth_headers(api_key))
 
     # Create a new policy
     bundle = {
@@ -680,12 +660,11 @@ def test_create_policy_endpoint(beadhub_server):
         "roles": {"tester": {"title": "Tester", "playbook_md": "Test playbook"}},
         "adapters": {},
     }
-    resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
+    resp = client.post(
+        "/v1/policies",
         json={"bundle": bundle},
     )
-    assert resp.status_code == 200
+    _assert_status(resp, 200)
 
     data = resp.json()
     assert data["project_id"] == project_id
@@ -694,38 +673,34 @@ def test_create_policy_endpoint(beadhub_server):
     assert "policy_id" in data
 
 
-def test_create_policy_increments_version(beadhub_server):
+def test_create_policy_increments_version(http_client, make_http_client):
     """Test POST /v1/policies increments version number."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-version-increment")
-
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
+    _project_id, api_key = _init_project(http_client, "test-version-increment")
+    client = make_http_client(_auth_headers(api_key))
 
     # Create first policy
-    resp1 = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle},
+    resp1 = client.post(
+        "/v1/policies",
+        content=_EMPTY_BUNDLE_BODY,
+        headers=_JSON_CONTENT_TYPE,
     )
     version1 = resp1.json()["version"]
 
     # Create second policy
-    resp2 = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle},
+    resp2 = client.post(
+        "/v1/policies",
+        content=_EMPTY_BUNDLE_BODY,
+        headers=_JSON_CONTENT_TYPE,
     )
     version2 = resp2.json()["version"]
 
     assert version2 == version1 + 1
 
 
-def test_activate_policy_endpoint(beadhub_server):
+def test_activate_policy_endpoint(http_client, make_http_client):
     """Test POST /v1/policies/{id}/activate sets active policy."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-activate-policy")
+    _project_id, api_key = _init_project(http_client, "test-activate-policy")
+    client = make_http_client(_auth_headers(api_key))
 
     # Create a policy
     bundle = {
@@ -733,89 +708,75 @@ def test_activate_policy_endpoint(beadhub_server):
         "roles": {"admin": {"title": "Admin", "playbook_md": ""}},
         "adapters": {},
     }
-    create_resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
+    create_resp = client.post(
+        "/v1/policies",
         json={"bundle": bundle},
     )
     policy_id = create_resp.json()["policy_id"]
 
     # Activate it
-    resp = httpx.post(
-        f"{beadhub_server}/v1/policies/{policy_id}/activate",
-        headers=_auth_headers(api_key),
-    )
-    assert resp.status_code == 200
+    resp = client.post(f"/v1/policies/{policy_id}/activate")
+    _assert_status(resp, 200)
 
     data = resp.json()
     assert data["activated"] is True
     assert data["active_policy_id"] == policy_id
 
     # Verify it's now active
-    get_resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
-    )
+    get_resp = client.get("/v1/policies/active")
     assert get_resp.json()["policy_id"] == policy_id
 
 
-def test_activate_policy_cross_project_rejected(beadhub_server):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_activate_policy_cross_project_rejected(async_http_client):
     """Test activating a policy from another project is rejected."""
-    import httpx
-
-    project1_id, api_key_1 = _init_project(beadhub_server, "test-cross-project-1")
-    project2_id, api_key_2 = _init_project(beadhub_server, "test-cross-project-2")
+    (_project1_id, api_key_1), (_project2_id, api_key_2) = await asyncio.gather(
+        _init_project_async(async_http_client, "test-cross-project-1"),
+        _init_project_async(async_http_client, "test-cross-project-2"),
+    )
 
     # Create policy in project 1
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-    create_resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key_1),
-        json={"bundle": bundle},
+    create_resp = await async_http_client.post(
+        "/v1/policies",
+        headers=_auth_headers(api_key_1) | _JSON_CONTENT_TYPE,
+        content=_EMPTY_BUNDLE_BODY,
     )
     policy_id = create_resp.json()["policy_id"]
 
     # Try to activate in project 2
-    resp = httpx.post(
-        f"{beadhub_server}/v1/policies/{policy_id}/activate",
+    resp = await async_http_client.post(
+        f"/v1/policies/{policy_id}/activate",
         headers=_auth_headers(api_key_2),
     )
-    assert resp.status_code == 400
+    _assert_status(resp, 400)
     assert "does not belong to this project" in resp.json()["detail"]
 
 
-def test_activate_nonexistent_policy(beadhub_server):
+def test_activate_nonexistent_policy(read_only_project):
     """Test activating a nonexistent policy returns 404."""
-    import httpx
+    _project_id, client = read_only_project
 
-    _project_id, api_key = _init_project(beadhub_server, "test-nonexistent-policy")
-
-    resp = httpx.post(
-        f"{beadhub_server}/v1/policies/00000000-0000-0000-0000-000000000000/activate",
-        headers=_auth_headers(api_key),
-    )
-    assert resp.status_code == 404
+    resp = client.post(f"{_ZERO_POLICY_URL}/activate")
+    _assert_status(resp, 404)
 
 
-def test_create_policy_missing_project_id(beadhub_server):
+def test_create_policy_missing_project_id(http_client):
     """Test POST /v1/policies without auth returns 401."""
-    import httpx
-
-    resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        json={"bundle": {"invariants": [], "roles": {}, "adapters": {}}},
+    resp = http_client.post(
+        "/v1/policies",
+        content=_EMPTY_BUNDLE_BODY,
+        headers=_JSON_CONTENT_TYPE,
     )
-    assert resp.status_code == 401
+    _assert_status(resp, 401)
 
 
 # Integration tests for GET /v1/policies/history endpoint
 
 
-def test_list_policy_history(beadhub_server):
+def test_list_policy_history(http_client, make_http_client):
     """Test GET /v1/policies/history returns policy versions."""
-    import httpx
-
-    project_id, api_key = _init_project(beadhub_server, "test-policy-history")
+    project_id, api_key = _init_project(http_client, "test-policy-history")
+    client = make_http_client(_auth_headers(api_key))
 
     # Create multiple policy versions
     bundle1 = {
@@ -834,31 +795,25 @@ def test_list_policy_history(beadhub_server):
         "adapters": {},
     }
 
-    resp1 = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
+    resp1 = client.post(
+        "/v1/policies",
         json={"bundle": bundle1},
     )
-    resp2 = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
+    resp2 = client.post(
+        "/v1/policies",
         json={"bundle": bundle2},
     )
-    resp3 = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
+    resp3 = client.post(
+        "/v1/policies",
         json={"bundle": bundle3},
     )
-    assert resp1.status_code == 200
-    assert resp2.status_code == 200
-    assert resp3.status_code == 200
+    _assert_status(resp1, 200)
+    _assert_status(resp2, 200)
+    _assert_status(resp3, 200)
 
     # Get history
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/history",
-        headers=_auth_headers(api_key),
-    )
-    assert resp.status_code == 200
+    resp = client.get("/v1/policies/history")
+    _assert_status(resp, 200)
 
     data = resp.json()
     assert "policies" in data
@@ -878,37 +833,30 @@ def test_list_policy_history(beadhub_server):
         assert "is_active" in policy
 
 
-def test_list_policy_history_marks_active(beadhub_server):
+def test_list_policy_history_marks_active(http_client, make_http_client):
     """Test GET /v1/policies/history marks the active policy."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-history-active-marker")
+    _project_id, api_key = _init_project(http_client, "test-history-active-marker")
+    client = make_http_client(_auth_headers(api_key))
 
     # Create two versions
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-    httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle},
+    resp1 = client.post(
+        "/v1/policies",
+        content=_EMPTY_BUNDLE_BODY,
+        headers=_JSON_CONTENT_TYPE,
     )
-    resp2 = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle},
+    _assert_status(resp1, 200)
+    resp2 = client.post(
+        "/v1/policies",
+        content=_EMPTY_BUNDLE_BODY,
+        headers=_JSON_CONTENT_TYPE,
     )
     policy2_id = resp2.json()["policy_id"]
 
     # Activate the second one
-    httpx.post(
-        f"{beadhub_server}/v1/policies/{policy2_id}/activate",
-        headers=_auth_headers(api_key),
-    )
+    _assert_status(client.post(f"/v1/policies/{policy2_id}/activate"), 200)
 
     # Get history
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/history",
-        headers=_auth_headers(api_key),
-    )
+    resp = client.get("/v1/policies/history")
     data = resp.json()
 
     active_count = sum(1 for p in data["policies"] if p["is_active"])
@@ -918,25 +866,23 @@ def test_list_policy_history_marks_active(beadhub_server):
     assert active_policy["policy_id"] == policy2_id
 
 
-def test_list_policy_history_limit(beadhub_server):
+def test_list_policy_history_limit(http_client, make_http_client):
     """Test GET /v1/policies/history respects limit parameter."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-history-limit")
+    _project_id, api_key = _init_project(http_client, "test-history-limit")
+    client = make_http_client(_auth_headers(api_key))
 
     # Create 5 policies
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
     for _ in range(5):
-        httpx.post(
-            f"{beadhub_server}/v1/policies",
-            headers=_auth_headers(api_key),
-            json={"bundle": bundle},
+        resp = client.post(
+            "/v1/policies",
+            content=_EMPTY_BUNDLE_BODY,
+            headers=_JSON_CONTENT_TYPE,
         )
+        _assert_status(resp, 200)
 
     # Get with limit=2
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/history",
-        headers=_auth_headers(api_key),
+    resp = client.get(
+        "/v1/policies/history",
         params={"limit": 2},
     )
     data = resp.json()
@@ -948,17 +894,13 @@ def test_list_policy_history_limit(beadhub_server):
     assert data["policies"][1]["version"] == 5
 
 
-def test_list_policy_history_empty_project(beadhub_server):
+def test_list_policy_history_empty_project(http_client, make_http_client):
     """Test GET /v1/policies/history for a newly-created project."""
-    import httpx
+    _project_id, api_key = _init_project(http_client, "test-history-empty")
+    client = make_http_client(_auth_headers(api_key))
 
-    _project_id, api_key = _init_project(beadhub_server, "test-history-empty")
-
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/history",
-        headers=_auth_headers(api_key),
-    )
-    assert resp.status_code == 200
+    resp = client.get("/v1/policies/history")
+    _assert_status(resp, 200)
 
     data = resp.json()
     # New projects get a seeded default policy.
@@ -967,41 +909,34 @@ def test_list_policy_history_empty_project(beadhub_server):
     assert data["policies"][0]["is_active"] is True
 
 
-def test_list_policy_history_missing_project_id(beadhub_server):
+def test_list_policy_history_missing_project_id(http_client):
     """Test GET /v1/policies/history without auth returns 401."""
-    import httpx
-
-    resp = httpx.get(f"{beadhub_server}/v1/policies/history")
-    assert resp.status_code == 401
+    resp = http_client.get("/v1/policies/history")
+    _assert_status(resp, 401)
 
 
 # GET /v1/policies/{policy_id} tests
 
 
-def test_get_policy_by_id(beadhub_server):
+def test_get_policy_by_id(http_client, make_http_client):
     """Test GET /v1/policies/{policy_id} returns the requested policy."""
-    import httpx
-
-    project_id, api_key = _init_project(beadhub_server, "test-get-policy-by-id")
+    project_id, api_key = _init_project(http_client, "test-get-policy-by-id")
+    client = make_http_client(_auth_headers(api_key))
 
     bundle = {
         "invariants": [{"id": "test.inv", "title": "Test", "body_md": "Test body"}],
         "roles": {"tester": {"title": "Tester", "playbook_md": "Test playbook"}},
         "adapters": {},
     }
-    create_resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
+    create_resp = client.post(
+        "/v1/policies",
         json={"bundle": bundle},
     )
-    assert create_resp.status_code == 200
+    _assert_status(create_resp, 200)
     policy_id = create_resp.json()["policy_id"]
 
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/{policy_id}",
-        headers=_auth_headers(api_key),
-    )
-    assert resp.status_code == 200
+    resp = client.get(f"/v1/policies/{policy_id}")
+    _assert_status(resp, 200)
 
     data = resp.json()
     assert data["policy_id"] == policy_id
@@ -1011,11 +946,10 @@ def test_get_policy_by_id(beadhub_server):
     assert "tester" in data["roles"]
 
 
-def test_reset_policy_to_default(beadhub_server):
+def test_reset_policy_to_default(http_client, make_http_client):
     """Test POST /v1/policies/reset creates+activates DEFAULT_POLICY_BUNDLE as new version."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-policy-reset-default")
+    _project_id, api_key = _init_project(http_client, "test-policy-reset-default")
+    client = make_http_client(_auth_headers(api_key))
 
     # Create a custom policy and activate it so we can observe reset behavior.
     bundle = {
@@ -1023,180 +957,123 @@ def test_reset_policy_to_default(beadhub_server):
         "roles": {},
         "adapters": {},
     }
-    create_resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
+    create_resp = client.post(
+        "/v1/policies",
         json={"bundle": bundle},
     )
-    assert create_resp.status_code == 200
+    _assert_status(create_resp, 200)
     custom_policy_id = create_resp.json()["policy_id"]
 
-    activate_resp = httpx.post(
-        f"{beadhub_server}/v1/policies/{custom_policy_id}/activate",
-        headers=_auth_headers(api_key),
-    )
-    assert activate_resp.status_code == 200
+    activate_resp = client.post(f"/v1/policies/{custom_policy_id}/activate")
+    _assert_status(activate_resp, 200)
 
     # Reset to default (creates a new version and activates it).
-    reset_resp = httpx.post(
-        f"{beadhub_server}/v1/policies/reset",
-        headers=_auth_headers(api_key),
-    )
-    assert reset_resp.status_code == 200
+    # include_active embeds the new active policy, saving a GET /v1/policies/active.
+    reset_resp = client.post("/v1/policies/reset", params={"include_active": "true"})
+    _assert_status(reset_resp, 200)
     reset_data = reset_resp.json()
     assert reset_data["reset"] is True
     assert reset_data["active_policy_id"]
     assert reset_data["version"] >= 1
 
     # Active policy should now include the seeded roles (coordinator, etc).
-    active_resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
-    )
-    assert active_resp.status_code == 200
-    active_data = active_resp.json()
+    active_data = reset_data["active"]
     assert active_data["policy_id"] == reset_data["active_policy_id"]
     assert "coordinator" in active_data["roles"]
     assert "developer" in active_data["roles"]
     assert "reviewer" in active_data["roles"]
 
+    # The reset must be persisted, not just echoed back in the response.
+    get_resp = client.get("/v1/policies/active")
+    _assert_status(get_resp, 200)
+    assert get_resp.json()["policy_id"] == reset_data["active_policy_id"]
 
-def test_get_policy_by_id_missing_project_id(beadhub_server):
-    """Test GET /v1/policies/{policy_id} without auth returns 401."""
-    import httpx
 
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/00000000-0000-0000-0000-000000000000",
-    )
-    assert resp.status_code == 401
+def test_reset_policy_omits_active_by_default(http_client, make_http_client):
+    """Test POST /v1/policies/reset leaves active null unless include_active is set."""
+    _project_id, api_key = _init_project(http_client, "test-policy-reset-no-active")
+    client = make_http_client(_auth_headers(api_key))
 
+    reset_resp = client.post("/v1/policies/reset")
+    _assert_status(reset_resp, 200)
+    reset_data = reset_resp.json()
+    assert reset_data["reset"] is True
+    assert reset_data["active_policy_id"]
+    assert reset_data["active"] is None
 
-def test_get_policy_by_id_cross_project_rejected(beadhub_server):
-    """Test GET /v1/policies/{policy_id} rejects cross-project access."""
-    import httpx
 
-    _project1_id, api_key_1 = _init_project(beadhub_server, "test-get-cross-1")
-    _project2_id, api_key_2 = _init_project(beadhub_server, "test-get-cross-2")
+def test_get_policy_by_id_missing_project_id(http_client):
+    """Test GET /v1/policies/{policy_id} without auth returns 401."""
+    resp = http_client.get(_ZERO_POLICY_URL)
+    _assert_status(resp, 401)
 
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-    create_resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key_1),
-        json={"bundle": bundle},
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_policy_by_id_cross_project_rejected(async_http_client):
+    """Test GET /v1/policies/{policy_id} rejects cross-project access."""
+    (_project1_id, api_key_1), (_project2_id, api_key_2) = await asyncio.gather(
+        _init_project_async(async_http_client, "test-get-cross-1"),
+        _init_project_async(async_http_client, "test-get-cross-2"),
+    )
+
+    create_resp = await async_http_client.post(
+        "/v1/policies",
+        headers=_auth_headers(api_key_1) | _JSON_CONTENT_TYPE,
+        content=_EMPTY_BUNDLE_BODY,
     )
     policy_id = create_resp.json()["policy_id"]
 
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/{policy_id}",
+    resp = await async_http_client.get(
+        f"/v1/policies/{policy_id}",
         headers=_auth_headers(api_key_2),
     )
-    assert resp.status_code == 404
+    _assert_status(resp, 404)
     assert "not found" in resp.json()["detail"].lower()
 
 
-def test_get_policy_by_id_nonexistent(beadhub_server):
+def test_get_policy_by_id_nonexistent(read_only_project):
     """Test GET /v1/policies/{policy_id} with nonexistent ID returns 404."""
-    import httpx
+    _project_id, client = read_only_project
 
-    _project_id, api_key = _init_project(beadhub_server, "test-get-nonexistent")
-
-    resp = httpx.get(
-        f"{beadhub_server}/v1/policies/00000000-0000-0000-0000-000000000000",
-        headers=_auth_headers(api_key),
-    )
-    assert resp.status_code == 404
+    resp = client.get(_ZERO_POLICY_URL)
+    _assert_status(resp, 404)
 
 
 # Optimistic concurrency tests
 
 
-def test_create_policy_with_stale_base_policy_id_returns_409(beadhub_server):
-    """POST /v1/policies with base_policy_id that doesn't match active returns 409."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-optimistic-conflict")
-
-    # Get the bootstrapped active policy
-    active_resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
-    )
-    assert active_resp.status_code == 200
-    original_policy_id = active_resp.json()["policy_id"]
-
-    # Agent A reads the active policy and creates a new version based on it
-    bundle_a = {
-        "invariants": [{"id": "a", "title": "A", "body_md": ""}],
-        "roles": {},
-        "adapters": {},
-    }
-    resp_a = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle_a, "base_policy_id": original_policy_id},
-    )
-    assert resp_a.status_code == 200
-    policy_a_id = resp_a.json()["policy_id"]
-
-    # Agent A activates their policy
-    httpx.post(
-        f"{beadhub_server}/v1/policies/{policy_a_id}/activate",
-        headers=_auth_headers(api_key),
-    )
-
-    # Agent B tries to create based on the ORIGINAL (now stale) policy
-    bundle_b = {
-        "invariants": [{"id": "b", "title": "B", "body_md": ""}],
-        "roles": {},
-        "adapters": {},
-    }
-    resp_b = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle_b, "base_policy_id": original_policy_id},
-    )
-    assert resp_b.status_code == 409
-    assert "conflict" in resp_b.json()["detail"].lower()
-
-
-def test_create_policy_with_matching_base_policy_id_succeeds(beadhub_server):
-    """POST /v1/policies with base_policy_id matching active succeeds."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-optimistic-match")
-
-    # Get the bootstrapped active policy
-    active_resp = httpx.get(
-        f"{beadhub_server}/v1/policies/active",
-        headers=_auth_headers(api_key),
-    )
-    active_policy_id = active_resp.json()["policy_id"]
-
-    # Create with matching base_policy_id
-    bundle = {
-        "invariants": [{"id": "ok", "title": "OK", "body_md": ""}],
-        "roles": {},
-        "adapters": {},
-    }
-    resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle, "base_policy_id": active_policy_id},
-    )
-    assert resp.status_code == 200
-
-
-def test_create_policy_without_base_policy_id_skips_check(beadhub_server):
-    """POST /v1/policies without base_policy_id always succeeds (backward compatible)."""
-    import httpx
-
-    _project_id, api_key = _init_project(beadhub_server, "test-optimistic-skip")
-
-    # Create without base_policy_id — should always work
-    bundle = {"invariants": [], "roles": {}, "adapters": {}}
-    resp = httpx.post(
-        f"{beadhub_server}/v1/policies",
-        headers=_auth_headers(api_key),
-        json={"bundle": bundle},
-    )
-    assert resp.status_code == 200
+@pytest.mark.parametrize(
+    "scenario,expected_status",
+    [
+        # Agent B read the original policy, but agent A activated a newer one since.
+        pytest.param("stale", 409, id="stale-returns-409"),
+        pytest.param("matching", 200, id="matching-succeeds"),
+        # Backward compatible: no base_policy_id means no check.
+        pytest.param("omitted", 200, id="omitted-skips-check"),
+    ],
+)
+def test_create_policy_base_policy_id_check(
+    project_ctx, make_http_client, scenario, expected_status
+):
+    """POST /v1/policies enforces base_policy_id against the active policy when given."""
+    ctx = project_ctx(f"test-optimistic-{scenario}")
+    client = make_http_client(_auth_headers(ctx.api_key))
+
+    if scenario == "stale":
+        # Agent A creates a version from the policy it read and activates it.
+        resp_a = client.post(
+            "/v1/policies",
+            json={"bundle": _EMPTY_BUNDLE, "base_policy_id": ctx.active_policy_id},
+        )
+        _assert_status(resp_a, 200)
+        policy_a_id = resp_a.json()["policy_id"]
+        _assert_status(client.post(f"/v1/policies/{policy_a_id}/activate"), 200)
+
+    body = {"bundle": _EMPTY_BUNDLE}
+    if scenario != "omitted":
+        # Both "stale" and "matching" send the id observed at init.
+        body["base_policy_id"] = ctx.active_policy_id
+    resp = client.post("/v1/policies", json=body)
+    _assert_status(resp, expected_status)
+    if expected_status == 409:
+        assert "conflict" in resp.json()["detail"].lower()
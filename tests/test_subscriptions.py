@@ -1,12 +1,35 @@
 """Tests for bead subscriptions and notifications."""
 
+import asyncio
 import json
 
 import pytest
-from asgi_lifespan import LifespanManager
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient, Response
 
-from beadhub.api import create_app
+from .conftest import uniq
+
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.usefixtures("reset_init_rate_limit"),
+]
+
+_SUBSCRIPTIONS_URL = "/v1/subscriptions"
+_UPLOAD_URL = "/v1/beads/upload"
+_INBOX_URL = "/v1/messages/inbox"
+_MCP_URL = "/mcp"
+
+# Fixed-shape bodies are serialized once and sent with content=.
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def _close_bead_body(bead_id: str) -> bytes:
+    return json.dumps(
+        {"repo": "outbox-repo", "issues": [{"id": bead_id, "status": "closed", "priority": 1}]}
+    ).encode()
+
+
+_CLOSE_OUTBOX_BEAD_BODY = _close_bead_body("outbox-bead")
+_CLOSE_TRACKED_BEAD_BODY = _close_bead_body("tracked-bead")
 
 
 async def _init_project_auth(
@@ -23,746 +46,449 @@ async def _init_project_auth(
             "agent_type": "agent",
         },
     )
-    assert aweb_resp.status_code == 200, aweb_resp.text
-    aweb_data = aweb_resp.json()
+    aweb_data = _ok(aweb_resp)
     api_key = aweb_data["api_key"]
+    headers = _auth_headers(api_key)
 
     resp = await client.post(
         "/v1/workspaces/register",
-        headers=_auth_headers(api_key),
+        headers=headers,
         json={
             "repo_origin": f"git@github.com:test/{project_slug}.git",
             "role": "agent",
         },
     )
-    assert resp.status_code == 200, resp.text
-    data = resp.json()
+    data = _ok(resp)
     data["api_key"] = api_key
+    data["headers"] = headers
     return data
 
 
+def _ok(resp: Response) -> dict:
+    """Assert a 200 response, showing the body on failure, and return its JSON."""
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
 def _auth_headers(api_key: str) -> dict[str, str]:
     return {"Authorization": f"Bearer {api_key}"}
 
 
-@pytest.mark.asyncio
-async def test_subscribe_to_bead(db_infra, async_redis):
+def _sub_payload(
+    init: dict[str, str],
+    bead_id: str,
+    *,
+    repo: str | None = None,
+    event_types: tuple[str, ...] = ("status_change",),
+) -> dict:
+    """Build a subscribe request body for the workspace returned by ``_init_project_auth``."""
+    payload = {
+        "workspace_id": init["workspace_id"],
+        "alias": init["alias"],
+        "bead_id": bead_id,
+        "event_types": list(event_types),
+    }
+    if repo is not None:
+        payload["repo"] = repo
+    return payload
+
+
+def _rpc(name: str, arguments: dict, id_: int = 1) -> dict:
+    """Build a JSON-RPC ``tools/call`` request for the MCP endpoint."""
+    return {
+        "jsonrpc": "2.0",
+        "id": id_,
+        "method": "tools/call",
+        "params": {"name": name, "arguments": arguments},
+    }
+
+
+async def test_subscribe_to_bead(shared_client, make_client):
     """Subscribe to a bead to receive notifications."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(
-                client, project_slug="test-sub-1", alias="watcher-agent"
-            )
-            resp = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher-agent",
-                    "bead_id": "beadhub-123",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["subscription_id"]
-            assert data["bead_id"] == "beadhub-123"
-            assert data["alias"] == "watcher-agent"
-
-
-@pytest.mark.asyncio
-async def test_subscribe_rejects_workspace_id_spoofing_within_project(db_infra, async_redis):
+    init = await _init_project_auth(
+        shared_client, project_slug=uniq("test-sub-1"), alias="watcher-agent"
+    )
+    client = make_client(init["headers"])
+    resp = await client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, "beadhub-123"))
+    data = _ok(resp)
+    assert data["subscription_id"]
+    assert data["bead_id"] == "beadhub-123"
+    assert data["alias"] == "watcher-agent"
+
+
+async def test_subscribe_rejects_workspace_id_spoofing_within_project(shared_client, make_client):
     """An agent API key must not be able to subscribe on behalf of another workspace in the same project."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            project_slug = "test-sub-spoof"
-            a = await _init_project_auth(client, project_slug=project_slug, alias="agent-a")
-            b = await _init_project_auth(client, project_slug=project_slug, alias="agent-b")
-
-            # Agent A attempts to subscribe as Agent B.
-            resp = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": b["workspace_id"],
-                    "alias": "agent-b",
-                    "bead_id": "beadhub-999",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(a["api_key"]),
-            )
-            assert resp.status_code == 403, resp.text
-
-
-@pytest.mark.asyncio
-async def test_subscribe_to_bead_with_repo(db_infra, async_redis):
+    project_slug = uniq("test-sub-spoof")
+    # Sequential on purpose: both agents join the same project, and
+    # concurrent inits would race to create it.
+    a = await _init_project_auth(shared_client, project_slug=project_slug, alias="agent-a")
+    b = await _init_project_auth(shared_client, project_slug=project_slug, alias="agent-b")
+    client_a = make_client(a["headers"])
+
+    # Agent A attempts to subscribe as Agent B.
+    resp = await client_a.post(_SUBSCRIPTIONS_URL, json=_sub_payload(b, "beadhub-999"))
+    assert resp.status_code == 403, resp.text
+
+
+async def test_subscribe_to_bead_with_repo(shared_client, make_client):
     """Subscribe to a repo-scoped bead."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(
-                client, project_slug="test-sub-2", alias="watcher-agent"
-            )
-            resp = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher-agent",
-                    "bead_id": "beadhub-456",
-                    "repo": "myrepo",
-                    "event_types": ["status_change", "priority_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            data = resp.json()
-            assert data["repo"] == "myrepo"
-
-
-@pytest.mark.asyncio
-async def test_list_subscriptions(db_infra, async_redis):
+    init = await _init_project_auth(
+        shared_client, project_slug=uniq("test-sub-2"), alias="watcher-agent"
+    )
+    client = make_client(init["headers"])
+    resp = await client.post(
+        _SUBSCRIPTIONS_URL,
+        json=_sub_payload(
+            init, "beadhub-456", repo="myrepo", event_types=("status_change", "priority_change")
+        ),
+    )
+    data = _ok(resp)
+    assert data["repo"] == "myrepo"
+
+
+async def test_list_subscriptions(shared_client, make_client):
     """List agent's subscriptions."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(client, project_slug="test-sub-3", alias="watcher")
-            # Create some subscriptions
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "bead-2",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            resp = await client.get(
-                "/v1/subscriptions",
-                params={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            data = resp.json()
-            assert len(data["subscriptions"]) == 2
-
-
-@pytest.mark.asyncio
-async def test_unsubscribe(db_infra, async_redis):
+    init = await _init_project_auth(shared_client, project_slug=uniq("test-sub-3"), alias="watcher")
+    client = make_client(init["headers"])
+    # Create some subscriptions
+    await asyncio.gather(
+        *(
+            client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, bead_id))
+            for bead_id in ("bead-1", "bead-2")
+        )
+    )
+
+    resp = await client.get(
+        _SUBSCRIPTIONS_URL,
+        params={
+            "workspace_id": init["workspace_id"],
+            "alias": "watcher",
+        },
+    )
+    data = _ok(resp)
+    assert len(data["subscriptions"]) == 2
+
+
+async def test_unsubscribe(shared_client, make_client):
     """Unsubscribe from a bead."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(client, project_slug="test-sub-4", alias="watcher")
-            # Subscribe
-            resp = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            subscription_id = resp.json()["subscription_id"]
-
-            # Unsubscribe
-            resp = await client.delete(
-                f"/v1/subscriptions/{subscription_id}",
-                params={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-
-            # Verify subscription is gone
-            resp = await client.get(
-                "/v1/subscriptions",
-                params={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.json()["subscriptions"] == []
-
-
-@pytest.mark.asyncio
-async def test_duplicate_subscription_rejected(db_infra, async_redis):
+    init = await _init_project_auth(shared_client, project_slug=uniq("test-sub-4"), alias="watcher")
+    client = make_client(init["headers"])
+    # Subscribe
+    resp = await client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, "bead-1"))
+    subscription_id = resp.json()["subscription_id"]
+
+    # Unsubscribe
+    resp = await client.delete(
+        f"{_SUBSCRIPTIONS_URL}/{subscription_id}",
+        params={
+            "workspace_id": init["workspace_id"],
+            "alias": "watcher",
+        },
+    )
+    assert resp.status_code == 200
+
+    # Verify subscription is gone
+    resp = await client.get(
+        _SUBSCRIPTIONS_URL,
+        params={
+            "workspace_id": init["workspace_id"],
+            "alias": "watcher",
+        },
+    )
+    assert resp.json()["subscriptions"] == []
+
+
+async def test_duplicate_subscription_rejected(shared_client, make_client):
     """Can't subscribe to the same bead twice with same event type."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(client, project_slug="test-sub-5", alias="watcher")
-            # First subscription
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            # Duplicate should return existing subscription
-            resp = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200  # Idempotent
-
-
-@pytest.mark.asyncio
-async def test_mcp_subscribe_to_bead(db_infra, async_redis):
+    init = await _init_project_auth(shared_client, project_slug=uniq("test-sub-5"), alias="watcher")
+    client = make_client(init["headers"])
+    # First subscription
+    await client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, "bead-1"))
+
+    # Duplicate should return existing subscription
+    resp = await client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, "bead-1"))
+    assert resp.status_code == 200  # Idempotent
+
+
+async def test_mcp_subscribe_to_bead(shared_client, make_client):
     """MCP tool to subscribe to a bead."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(
-                client, project_slug="test-sub-mcp-1", alias="mcp-watcher"
-            )
-            rpc_payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": "subscribe_to_bead",
-                    "arguments": {
-                        "workspace_id": init["workspace_id"],
-                        "bead_id": "bead-mcp-1",
-                    },
-                },
-            }
-
-            resp = await client.post(
-                "/mcp", json=rpc_payload, headers=_auth_headers(init["api_key"])
-            )
-            assert resp.status_code == 200
-            result = resp.json()
-            assert "error" not in result
-
-            content = json.loads(result["result"]["content"][0]["text"])
-            assert content["subscription_id"]
-
-
-@pytest.mark.asyncio
-async def test_mcp_list_subscriptions(db_infra, async_redis):
+    init = await _init_project_auth(
+        shared_client, project_slug=uniq("test-sub-mcp-1"), alias="mcp-watcher"
+    )
+    client = make_client(init["headers"])
+    rpc_payload = _rpc(
+        "subscribe_to_bead",
+        {"workspace_id": init["workspace_id"], "bead_id": "bead-mcp-1"},
+    )
+
+    resp = await client.post(_MCP_URL, json=rpc_payload)
+    result = _ok(resp)
+    assert "error" not in result
+
+    content = json.loads(result["result"]["content"][0]["text"])
+    assert content["subscription_id"]
+
+
+async def test_mcp_list_subscriptions(shared_client, make_client):
     """MCP tool to list subscriptions."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(
-                client, project_slug="test-sub-mcp-2", alias="mcp-watcher"
-            )
-            # Subscribe via REST
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "mcp-watcher",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            # List via MCP
-            rpc_payload = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/call",
-                "params": {
-                    "name": "list_subscriptions",
-                    "arguments": {
-                        "workspace_id": init["workspace_id"],
-                    },
-                },
-            }
-
-            resp = await client.post(
-                "/mcp", json=rpc_payload, headers=_auth_headers(init["api_key"])
-            )
-            assert resp.status_code == 200
-            result = resp.json()
-            assert "error" not in result
-
-            content = json.loads(result["result"]["content"][0]["text"])
-            assert len(content["subscriptions"]) == 1
-
-
-@pytest.mark.asyncio
-async def test_mcp_unsubscribe(db_infra, async_redis):
+    init = await _init_project_auth(
+        shared_client, project_slug=uniq("test-sub-mcp-2"), alias="mcp-watcher"
+    )
+    client = make_client(init["headers"])
+    # Subscribe via REST
+    await client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, "bead-1"))
+
+    # List via MCP
+    rpc_payload = _rpc("list_subscriptions", {"workspace_id": init["workspace_id"]}, id_=2)
+
+    resp = await client.post(_MCP_URL, json=rpc_payload)
+    result = _ok(resp)
+    assert "error" not in result
+
+    content = json.loads(result["result"]["content"][0]["text"])
+    assert len(content["subscriptions"]) == 1
+
+
+async def test_mcp_unsubscribe(shared_client, make_client):
     """MCP tool to unsubscribe from a bead."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(
-                client, project_slug="test-sub-mcp-3", alias="mcp-watcher"
-            )
-            # Subscribe first
-            sub_resp = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "mcp-watcher",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            subscription_id = sub_resp.json()["subscription_id"]
-
-            # Unsubscribe via MCP
-            rpc_payload = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/call",
-                "params": {
-                    "name": "unsubscribe",
-                    "arguments": {
-                        "workspace_id": init["workspace_id"],
-                        "subscription_id": subscription_id,
-                    },
-                },
-            }
-
-            resp = await client.post(
-                "/mcp", json=rpc_payload, headers=_auth_headers(init["api_key"])
-            )
-            assert resp.status_code == 200
-            result = resp.json()
-            assert "error" not in result
-
-
-@pytest.mark.asyncio
-async def test_notification_on_status_change(db_infra, async_redis):
+    init = await _init_project_auth(
+        shared_client, project_slug=uniq("test-sub-mcp-3"), alias="mcp-watcher"
+    )
+    client = make_client(init["headers"])
+    # Subscribe first
+    sub_resp = await client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, "bead-1"))
+    subscription_id = sub_resp.json()["subscription_id"]
+
+    # Unsubscribe via MCP
+    rpc_payload = _rpc(
+        "unsubscribe",
+        {"workspace_id": init["workspace_id"], "subscription_id": subscription_id},
+        id_=3,
+    )
+
+    resp = await client.post(_MCP_URL, json=rpc_payload)
+    result = _ok(resp)
+    assert "error" not in result
+
+
+async def _watch_open_bead(
+    shared_client: AsyncClient, make_client, *, project_slug: str, repo: str, issue: dict
+) -> tuple[dict[str, str], AsyncClient]:
+    """Init a project whose "watcher" agent is subscribed to ``issue``, uploaded as open.
+
+    Subscribing does not require the bead to exist, so the upload and the
+    subscription are sent concurrently.
+    """
+    init = await _init_project_auth(shared_client, project_slug=project_slug, alias="watcher")
+    client = make_client(init["headers"])
+    upload_resp, sub_resp = await asyncio.gather(
+        client.post(_UPLOAD_URL, json={"repo": repo, "issues": [issue]}),
+        client.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init, issue["id"], repo=repo)),
+    )
+    assert _ok(upload_resp)["issues_added"] == 1
+    assert sub_resp.status_code == 200, sub_resp.text
+    return init, client
+
+
+async def test_notification_on_status_change(shared_client, make_client):
     """Subscribers receive notification when bead status changes."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(client, project_slug="test-sub-notify", alias="watcher")
-
-            # First upload to create the bead as open
-            resp = await client.post(
-                "/v1/beads/upload",
-                json={
-                    "repo": "notify-repo",
-                    "issues": [
-                        {
-                            "id": "test-bead-1",
-                            "title": "Test Issue",
-                            "status": "open",
-                            "priority": 1,
-                            "issue_type": "task",
-                        }
-                    ],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            assert resp.json()["issues_added"] == 1
-
-            # Subscribe to the bead (using raw bead_id, repo is separate)
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "test-bead-1",
-                    "repo": "notify-repo",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            # Upload again with status changed to closed - should trigger notification
-            resp = await client.post(
-                "/v1/beads/upload",
-                json={
-                    "repo": "notify-repo",
-                    "issues": [
-                        {
-                            "id": "test-bead-1",
-                            "title": "Test Issue",
-                            "status": "closed",
-                            "priority": 1,
-                            "issue_type": "task",
-                        }
-                    ],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            sync_result = resp.json()
-            assert sync_result["issues_updated"] == 1
-            assert sync_result["notifications_sent"] == 1
-
-            # Check watcher's inbox for notification
-            inbox_resp = await client.get(
-                "/v1/messages/inbox",
-                params={"agent_id": init["workspace_id"]},
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert inbox_resp.status_code == 200
-            inbox = inbox_resp.json()
-            assert len(inbox["messages"]) == 1
-            msg = inbox["messages"][0]
-            assert "status changed" in msg["subject"]
-            assert "open" in msg["body"]
-            assert "closed" in msg["body"]
-
-
-@pytest.mark.asyncio
-async def test_no_notification_for_new_beads(db_infra, async_redis):
+    issue = {
+        "id": "test-bead-1",
+        "title": "Test Issue",
+        "status": "open",
+        "priority": 1,
+        "issue_type": "task",
+    }
+    init, client = await _watch_open_bead(
+        shared_client,
+        make_client,
+        project_slug=uniq("test-sub-notify"),
+        repo="notify-repo",
+        issue=issue,
+    )
+
+    # Upload again with status changed to closed - should trigger notification
+    resp = await client.post(
+        _UPLOAD_URL,
+        json={"repo": "notify-repo", "issues": [{**issue, "status": "closed"}]},
+    )
+    sync_result = _ok(resp)
+    assert sync_result["issues_updated"] == 1
+    assert sync_result["notifications_sent"] == 1
+
+    # Check watcher's inbox for notification
+    inbox_resp = await client.get(
+        _INBOX_URL,
+        params={"agent_id": init["workspace_id"]},
+    )
+    inbox = _ok(inbox_resp)
+    assert len(inbox["messages"]) == 1
+    msg = inbox["messages"][0]
+    assert "status changed" in msg["subject"]
+    assert "open" in msg["body"]
+    assert "closed" in msg["body"]
+
+
+async def test_no_notification_for_new_beads(shared_client, make_client):
     """New beads don't trigger notifications (only status changes do)."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(
-                client, project_slug="test-sub-no-notify", alias="watcher"
-            )
-
-            # Subscribe to a bead that doesn't exist yet
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "future-bead",
-                    "repo": "no-notify-repo",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            # Upload - creates new bead
-            resp = await client.post(
-                "/v1/beads/upload",
-                json={
-                    "repo": "no-notify-repo",
-                    "issues": [
-                        {
-                            "id": "future-bead",
-                            "title": "Future Issue",
-                            "status": "open",
-                            "priority": 1,
-                        }
-                    ],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            # New beads don't send notifications
-            assert resp.json()["notifications_sent"] == 0
-
-            # Inbox should be empty
-            inbox_resp = await client.get(
-                "/v1/messages/inbox",
-                params={"agent_id": init["workspace_id"]},
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert inbox_resp.status_code == 200
-            assert len(inbox_resp.json()["messages"]) == 0
-
-
-@pytest.mark.asyncio
-async def test_notification_outbox_records_failures(db_infra, async_redis):
+    init = await _init_project_auth(
+        shared_client, project_slug=uniq("test-sub-no-notify"), alias="watcher"
+    )
+    client = make_client(init["headers"])
+
+    # Subscribe to a bead that doesn't exist yet
+    await client.post(
+        _SUBSCRIPTIONS_URL,
+        json=_sub_payload(init, "future-bead", repo="no-notify-repo"),
+    )
+
+    # Upload - creates new bead
+    resp = await client.post(
+        _UPLOAD_URL,
+        json={
+            "repo": "no-notify-repo",
+            "issues": [
+                {
+                    "id": "future-bead",
+                    "title": "Future Issue",
+                    "status": "open",
+                    "priority": 1,
+                }
+            ],
+        },
+    )
+    assert resp.status_code == 200
+    # New beads don't send notifications
+    assert resp.json()["notifications_sent"] == 0
+
+    # Inbox should be empty
+    inbox_resp = await client.get(
+        _INBOX_URL,
+        params={"agent_id": init["workspace_id"]},
+    )
+    assert len(_ok(inbox_resp)["messages"]) == 0
+
+
+async def test_notification_outbox_records_failures(shared_client, make_client):
     """Failed notifications are recorded in the outbox for retry."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(
-                client, project_slug="test-outbox-fail", alias="watcher"
-            )
-
-            # First upload to create the bead
-            await client.post(
-                "/v1/beads/upload",
-                json={
-                    "repo": "outbox-repo",
-                    "issues": [{"id": "outbox-bead", "status": "open", "priority": 1}],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            # Subscribe, then delete workspace to force notification failure
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "outbox-bead",
-                    "repo": "outbox-repo",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            delete_resp = await client.delete(
-                f"/v1/workspaces/{init['workspace_id']}",
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert delete_resp.status_code == 200
-
-            # Upload status change - should record outbox entry but fail to send
-            resp = await client.post(
-                "/v1/beads/upload",
-                json={
-                    "repo": "outbox-repo",
-                    "issues": [{"id": "outbox-bead", "status": "closed", "priority": 1}],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            result = resp.json()
-            # Notification failed because workspace doesn't exist
-            assert result["notifications_failed"] == 1
-            assert result["notifications_sent"] == 0
-
-
-@pytest.mark.asyncio
-async def test_notification_outbox_tracks_completed(db_infra, async_redis):
+    init, client = await _watch_open_bead(
+        shared_client,
+        make_client,
+        project_slug=uniq("test-outbox-fail"),
+        repo="outbox-repo",
+        issue={"id": "outbox-bead", "status": "open", "priority": 1},
+    )
+
+    # Delete the subscribed workspace to force notification failure
+    delete_resp = await client.delete(f"/v1/workspaces/{init['workspace_id']}")
+    assert delete_resp.status_code == 200
+
+    # Upload status change - should record outbox entry but fail to send
+    resp = await client.post(
+        _UPLOAD_URL, content=_CLOSE_OUTBOX_BEAD_BODY, headers=_JSON_CONTENT_TYPE
+    )
+    result = _ok(resp)
+    # Notification failed because workspace doesn't exist
+    assert result["notifications_failed"] == 1
+    assert result["notifications_sent"] == 0
+
+
+async def test_notification_outbox_tracks_completed(shared_client, make_client):
     """Completed notifications are tracked in the outbox with message_id."""
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init = await _init_project_auth(client, project_slug="test-outbox-ok", alias="watcher")
-
-            # First upload to create the bead
-            await client.post(
-                "/v1/beads/upload",
-                json={
-                    "repo": "outbox-repo",
-                    "issues": [{"id": "tracked-bead", "status": "open", "priority": 1}],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            # Subscribe
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init["workspace_id"],
-                    "alias": "watcher",
-                    "bead_id": "tracked-bead",
-                    "repo": "outbox-repo",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-
-            # Upload status change
-            resp = await client.post(
-                "/v1/beads/upload",
-                json={
-                    "repo": "outbox-repo",
-                    "issues": [{"id": "tracked-bead", "status": "closed", "priority": 1}],
-                },
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert resp.status_code == 200
-            result = resp.json()
-            assert result["notifications_sent"] == 1
-            assert result["notifications_failed"] == 0
-
-            # Verify inbox received the notification
-            inbox_resp = await client.get(
-                "/v1/messages/inbox",
-                params={"agent_id": init["workspace_id"]},
-                headers=_auth_headers(init["api_key"]),
-            )
-            assert inbox_resp.status_code == 200
-            assert len(inbox_resp.json()["messages"]) == 1
-
-
-@pytest.mark.asyncio
-async def test_list_subscriptions_tenant_isolation(db_infra, async_redis):
+    init, client = await _watch_open_bead(
+        shared_client,
+        make_client,
+        project_slug=uniq("test-outbox-ok"),
+        repo="outbox-repo",
+        issue={"id": "tracked-bead", "status": "open", "priority": 1},
+    )
+
+    # Upload status change
+    resp = await client.post(
+        _UPLOAD_URL, content=_CLOSE_TRACKED_BEAD_BODY, headers=_JSON_CONTENT_TYPE
+    )
+    result = _ok(resp)
+    assert result["notifications_sent"] == 1
+    assert result["notifications_failed"] == 0
+
+    # Verify inbox received the notification
+    inbox_resp = await client.get(
+        _INBOX_URL,
+        params={"agent_id": init["workspace_id"]},
+    )
+    assert len(_ok(inbox_resp)["messages"]) == 1
+
+
+async def test_list_subscriptions_tenant_isolation(shared_client, make_client):
     """list_subscriptions should only show subscriptions for the requesting project.
 
     SECURITY TEST: Even if the same workspace_id exists in multiple projects,
     listing subscriptions should only show those for the requesting project.
     """
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init_a = await _init_project_auth(client, project_slug="test-iso-a", alias="agent-a")
-            init_b = await _init_project_auth(client, project_slug="test-iso-b", alias="agent-b")
-
-            # Project A subscribes to bead-1
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init_a["workspace_id"],
-                    "alias": "agent-a",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init_a["api_key"]),
-            )
-
-            # Project B subscribes to bead-2
-            await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init_b["workspace_id"],
-                    "alias": "agent-b",
-                    "bead_id": "bead-2",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init_b["api_key"]),
-            )
-
-            # List as Project A - should only see bead-1
-            resp_a = await client.get(
-                "/v1/subscriptions",
-                params={"workspace_id": init_a["workspace_id"], "alias": "agent-a"},
-                headers=_auth_headers(init_a["api_key"]),
-            )
-            assert resp_a.status_code == 200
-            subs_a = resp_a.json()["subscriptions"]
-            assert len(subs_a) == 1
-            assert subs_a[0]["bead_id"] == "bead-1"
-
-            # List as Project B - should only see bead-2
-            resp_b = await client.get(
-                "/v1/subscriptions",
-                params={"workspace_id": init_b["workspace_id"], "alias": "agent-b"},
-                headers=_auth_headers(init_b["api_key"]),
-            )
-            assert resp_b.status_code == 200
-            subs_b = resp_b.json()["subscriptions"]
-            assert len(subs_b) == 1
-            assert subs_b[0]["bead_id"] == "bead-2"
-
-
-@pytest.mark.asyncio
-async def test_unsubscribe_tenant_isolation(db_infra, async_redis):
+    init_a, init_b = await asyncio.gather(
+        _init_project_auth(shared_client, project_slug=uniq("test-iso-a"), alias="agent-a"),
+        _init_project_auth(shared_client, project_slug=uniq("test-iso-b"), alias="agent-b"),
+    )
+    client_a, client_b = make_client(init_a["headers"]), make_client(init_b["headers"])
+
+    # Project A subscribes to bead-1, Project B to bead-2
+    await asyncio.gather(
+        client_a.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init_a, "bead-1")),
+        client_b.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init_b, "bead-2")),
+    )
+
+    # List as Project A - should only see bead-1
+    resp_a = await client_a.get(
+        _SUBSCRIPTIONS_URL,
+        params={"workspace_id": init_a["workspace_id"], "alias": "agent-a"},
+    )
+    subs_a = _ok(resp_a)["subscriptions"]
+    assert len(subs_a) == 1
+    assert subs_a[0]["bead_id"] == "bead-1"
+
+    # List as Project B - should only see bead-2
+    resp_b = await client_b.get(
+        _SUBSCRIPTIONS_URL,
+        params={"workspace_id": init_b["workspace_id"], "alias": "agent-b"},
+    )
+    subs_b = _ok(resp_b)["subscriptions"]
+    assert len(subs_b) == 1
+    assert subs_b[0]["bead_id"] == "bead-2"
+
+
+async def test_unsubscribe_tenant_isolation(shared_client, make_client):
     """unsubscribe should only delete subscriptions from the requesting project.
 
     SECURITY TEST: Project A should not be able to delete Project B's subscriptions.
     """
-    app = create_app(db_infra=db_infra, redis=async_redis, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(
-            transport=ASGITransport(app=app),
-            base_url="http://test",
-        ) as client:
-            init_a = await _init_project_auth(
-                client, project_slug="test-unsub-iso-a", alias="agent-a"
-            )
-            init_b = await _init_project_auth(
-                client, project_slug="test-unsub-iso-b", alias="agent-b"
-            )
-
-            # Project A subscribes
-            resp_a = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init_a["workspace_id"],
-                    "alias": "agent-a",
-                    "bead_id": "bead-1",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init_a["api_key"]),
-            )
-            sub_id_a = resp_a.json()["subscription_id"]
-
-            # Project B subscribes
-            resp_b = await client.post(
-                "/v1/subscriptions",
-                json={
-                    "workspace_id": init_b["workspace_id"],
-                    "alias": "agent-b",
-                    "bead_id": "bead-2",
-                    "event_types": ["status_change"],
-                },
-                headers=_auth_headers(init_b["api_key"]),
-            )
-            assert resp_b.status_code == 200  # Confirm subscription created
-
-            # Project B tries to delete Project A's subscription - should fail (404)
-            resp = await client.delete(
-                f"/v1/subscriptions/{sub_id_a}",
-                params={"workspace_id": init_b["workspace_id"], "alias": "agent-b"},
-                headers=_auth_headers(init_b["api_key"]),
-            )
-            assert (
-                resp.status_code == 404
-            ), "SECURITY VIOLATION: Project B was able to delete Project A's subscription"
-
-            # Verify Project A's subscription still exists
-            resp_check = await client.get(
-                "/v1/subscriptions",
-                params={"workspace_id": init_a["workspace_id"], "alias": "agent-a"},
-                headers=_auth_headers(init_a["api_key"]),
-            )
-            subs = resp_check.json()["subscriptions"]
-            assert len(subs) == 1
-            assert subs[0]["subscription_id"] == sub_id_a
+    init_a, init_b = await asyncio.gather(
+        _init_project_auth(shared_client, project_slug=uniq("test-unsub-iso-a"), alias="agent-a"),
+        _init_project_auth(shared_client, project_slug=uniq("test-unsub-iso-b"), alias="agent-b"),
+    )
+    client_a, client_b = make_client(init_a["headers"]), make_client(init_b["headers"])
+
+    # Both projects subscribe
+    resp_a, resp_b = await asyncio.gather(
+        client_a.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init_a, "bead-1")),
+        client_b.post(_SUBSCRIPTIONS_URL, json=_sub_payload(init_b, "bead-2")),
+    )
+    sub_id_a = resp_a.json()["subscription_id"]
+    assert resp_b.status_code == 200  # Confirm subscription created
+
+    # Project B tries to delete Project A's subscription - should fail (404)
+    resp = await client_b.delete(
+        f"{_SUBSCRIPTIONS_URL}/{sub_id_a}",
+        params={"workspace_id": init_b["workspace_id"], "alias": "agent-b"},
+    )
+    assert (
+        resp.status_code == 404
+    ), "SECURITY VIOLATION: Project B was able to delete Project A's subscription"
+
+    # Verify Project A's subscription still exists
+    resp_check = await client_a.get(
+        _SUBSCRIPTIONS_URL,
+        params={"workspace_id": init_a["workspace_id"], "alias": "agent-a"},
+    )
+    subs = resp_check.json()["subscriptions"]
+    assert len(subs) == 1
+    assert subs[0]["subscription_id"] == sub_id_a
@@ -1,71 +1,85 @@
+import asyncio
+from dataclasses import dataclass
+
 import pytest
-from asgi_lifespan import LifespanManager
-from httpx import ASGITransport, AsyncClient
+import pytest_asyncio
 
-from beadhub.api import create_app
+from .conftest import auth_headers, uniq
 
-from .conftest import auth_headers
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.usefixtures("reset_init_rate_limit"),
+]
 
+_INIT_DEFAULTS = {"human_name": "Init User", "role": "agent"}
+_SUGGEST_URL = "/v1/workspaces/suggest-name-prefix"
 
-@pytest.mark.asyncio
-async def test_suggest_name_prefix_uses_authenticated_project_even_if_repo_registered_elsewhere(
-    db_infra, redis_client_async
-):
-    app = create_app(db_infra=db_infra, redis=redis_client_async, serve_frontend=False)
-    async with LifespanManager(app):
-        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
-            # Project A registers repo-a and consumes the "alice" classic prefix.
-            resp_a = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": "test-snp-project-a",
-                    "project_name": "test-snp-project-a",
-                    "repo_origin": "git@github.com:test/snp-repo-a.git",
-                    "alias": "alice-agent",
-                    "human_name": "Init User",
-                    "role": "agent",
-                },
-            )
-            assert resp_a.status_code == 200, resp_a.text
 
-            # Project B exists (with a different repo) and authenticates with its own API key.
-            resp_b = await client.post(
-                "/v1/init",
-                json={
-                    "project_slug": "test-snp-project-b",
-                    "project_name": "test-snp-project-b",
-                    "repo_origin": "git@github.com:test/snp-repo-b.git",
-                    "alias": "zz-agent",
-                    "human_name": "Init User",
-                    "role": "agent",
-                },
-            )
-            assert resp_b.status_code == 200, resp_b.text
-            b = resp_b.json()
-            api_key_b = b["api_key"]
-            project_id_b = b["project_id"]
+def _init_payload(slug: str, **fields) -> dict:
+    """Build a /v1/init body for ``slug``; ``fields`` add to or override the defaults."""
+    return _INIT_DEFAULTS | {"project_slug": slug, "project_name": slug} | fields
+
+
+@dataclass(frozen=True)
+class ScopingProjects:
+    repo_a: str
+    suggest_body: dict[str, str]
+    inits: dict[str, dict]  # "a" / "b" -> /v1/init response
+
 
-            # Unauthenticated call should use the repo's owning project (project A) and suggest "bob".
-            unauth = await client.post(
-                "/v1/workspaces/suggest-name-prefix",
-                json={"origin_url": "git@github.com:test/snp-repo-a.git"},
-            )
-            assert unauth.status_code == 200, unauth.text
-            unauth_data = unauth.json()
-            assert unauth_data["project_slug"] == "test-snp-project-a"
-            assert unauth_data["name_prefix"] == "bob"
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def scoping_projects(shared_client) -> ScopingProjects:
+    """Two projects, initialised once per module; the cases below only read them.
 
-            # Authenticated to project B, suggestion must be scoped to project B (no cross-project leak),
-            # even though the repo is currently registered in project A.
-            auth = await client.post(
-                "/v1/workspaces/suggest-name-prefix",
-                json={"origin_url": "git@github.com:test/snp-repo-a.git"},
-                headers=auth_headers(api_key_b),
-            )
-            assert auth.status_code == 200, auth.text
-            auth_data = auth.json()
-            assert auth_data["project_id"] == project_id_b
-            assert auth_data["project_slug"] == "test-snp-project-b"
-            assert auth_data["canonical_origin"] == "github.com/test/snp-repo-a"
-            assert auth_data["repo_id"] == ""
-            assert auth_data["name_prefix"] == "alice"
+    Project A registers repo-a and consumes the "alice" classic prefix.
+    Project B exists (with a different repo) and authenticates with its own API key.
+    """
+    # The database is shared across the session, so slugs and repos must be unique.
+    slug_a, slug_b = uniq("test-snp-project-a"), uniq("test-snp-project-b")
+    repo_a, repo_b = uniq("snp-repo-a"), uniq("snp-repo-b")
+    origin_a = f"git@github.com:test/{repo_a}.git"
+    origin_b = f"git@github.com:test/{repo_b}.git"
+
+    resp_a, resp_b = await asyncio.gather(
+        shared_client.post(
+            "/v1/init", json=_init_payload(slug_a, repo_origin=origin_a, alias="alice-agent")
+        ),
+        shared_client.post(
+            "/v1/init", json=_init_payload(slug_b, repo_origin=origin_b, alias="zz-agent")
+        ),
+    )
+    assert resp_a.status_code == 200, resp_a.text
+    assert resp_b.status_code == 200, resp_b.text
+    return ScopingProjects(
+        repo_a=repo_a,
+        suggest_body={"origin_url": origin_a},
+        inits={"a": resp_a.json(), "b": resp_b.json()},
+    )
+
+
+@pytest.mark.parametrize(
+    "authenticated,owner,name_prefix,owner_has_repo",
+    [
+        # Unauthenticated call should use the repo's owning project (project A) and suggest "bob".
+        pytest.param(False, "a", "bob", True, id="unauthenticated-uses-repo-owner"),
+        # Authenticated to project B, suggestion must be scoped to project B (no cross-project
+        # leak), even though the repo is currently registered in project A.
+        pytest.param(True, "b", "alice", False, id="authenticated-uses-own-project"),
+    ],
+)
+async def test_suggest_name_prefix_uses_authenticated_project_even_if_repo_registered_elsewhere(
+    shared_client, scoping_projects, authenticated, owner, name_prefix, owner_has_repo
+):
+    headers = auth_headers(scoping_projects.inits["b"]["api_key"]) if authenticated else None
+    resp = await shared_client.post(
+        _SUGGEST_URL, json=scoping_projects.suggest_body, headers=headers
+    )
+    assert resp.status_code == 200, resp.text
+    project = scoping_projects.inits[owner]
+    assert resp.json() == {
+        "project_id": project["project_id"],
+        "project_slug": project["project_slug"],
+        "canonical_origin": f"github.com/test/{scoping_projects.repo_a}",
+        "repo_id": project["repo_id"] if owner_has_repo else "",
+        "name_prefix": name_prefix,
+    }
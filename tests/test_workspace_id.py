@@ -12,7 +12,7 @@ from beadhub.api import create_app
 from beadhub.auth import validate_workspace_id
 from beadhub.presence import _presence_key
 
-TEST_REDIS_URL = "redis://localhost:6379/15"
+from .conftest import TEST_REDIS_URL
 
 
 async def _init_project_auth(